@@ -13,6 +13,9 @@ from typing import List, Literal, Optional
 from openviking.message.part import ContextPart, Part, TextPart, ToolPart
 from openviking.utils.time_utils import format_iso8601, parse_iso_datetime
 
+# json.dumps builds a fresh JSONEncoder whenever non-default options are passed
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 @dataclass
 class Message:
@@ -183,4 +186,4 @@ class Message:
 
     def to_jsonl(self) -> str:
         """Serialize to JSONL string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        return _JSON_ENCODER.encode(self.to_dict())
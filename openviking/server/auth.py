@@ -57,7 +57,7 @@ async def get_request_context(
 ) -> RequestContext:
     """Convert ResolvedIdentity to RequestContext."""
     return RequestContext(
-        user=UserIdentifier(
+        user=UserIdentifier.of(
             identity.account_id or "default",
             identity.user_id or "default",
             identity.agent_id or "default",
@@ -4,7 +4,7 @@
 
 from typing import Any, Dict, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query
 from pydantic import BaseModel, model_validator
 
 from openviking.message.part import TextPart, part_from_dict
@@ -141,11 +141,12 @@ async def delete_session(
 @router.post("/{session_id}/commit")
 async def commit_session(
     session_id: str = Path(..., description="Session ID"),
+    wait: bool = Query(True, description="Wait for the commit to finish"),
     _ctx: RequestContext = Depends(get_request_context),
 ):
     """Commit a session (archive and extract memories)."""
     service = get_service()
-    result = await service.sessions.commit(session_id, _ctx)
+    result = await service.sessions.commit(session_id, _ctx, wait=wait)
     return Response(status="ok", result=result)
 
 
@@ -288,6 +288,8 @@ class OpenVikingService:
 
     async def close(self) -> None:
         """Close OpenViking and release resources."""
+        await self._session_service.close()
+
         if self._transaction_manager:
             self._transaction_manager.stop()
             self._transaction_manager = None
@@ -6,7 +6,8 @@ Session Service for OpenViking.
 Provides session management operations: session, sessions, add_message, commit, delete.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from openviking.server.identity import RequestContext
 from openviking.session import Session
@@ -19,6 +20,91 @@ from openviking_cli.utils import get_logger
 logger = get_logger(__name__)
 
 
+class CommitBatcher:
+    """Bounded background queue for ``commit(wait=False)`` requests.
+
+    A single worker drains up to ``max_batch`` requests arriving within
+    ``window`` seconds and commits each distinct session once, so bursts of
+    commits for the same session collapse into one archive/extraction pass
+    and background concurrency stays at one commit at a time.
+    """
+
+    def __init__(
+        self,
+        commit_fn: Callable[[str, RequestContext], Awaitable[Any]],
+        maxsize: int = 256,
+        max_batch: int = 32,
+        window: float = 0.005,
+    ):
+        self._commit_fn = commit_fn
+        self._maxsize = maxsize
+        self._max_batch = max_batch
+        self._window = window
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._maxsize)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return self._queue
+
+    async def submit(self, session_id: str, ctx: RequestContext) -> None:
+        """Enqueue a commit; waits only when the queue is full."""
+        await self._ensure_worker().put((session_id, ctx))
+
+    async def flush(self) -> None:
+        """Wait until every queued commit has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Process pending commits, then stop the worker."""
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _drain(self) -> List[Tuple[str, RequestContext]]:
+        queue = self._queue
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._window
+        while len(batch) < self._max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._drain()
+            # Same session twice in one window: the first commit already archives
+            # every message added so far, so only the latest request is kept.
+            pending: Dict[Tuple[str, str, str], Tuple[str, RequestContext]] = {}
+            for session_id, ctx in batch:
+                key = (ctx.account_id, ctx.user.user_space_name(), session_id)
+                pending[key] = (session_id, ctx)
+            try:
+                for session_id, ctx in pending.values():
+                    try:
+                        await self._commit_fn(session_id, ctx)
+                    except Exception as e:
+                        logger.error(f"Background commit failed for session {session_id}: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
 class SessionService:
     """Session management service."""
 
@@ -31,6 +117,7 @@ class SessionService:
         self._vikingdb = vikingdb
         self._viking_fs = viking_fs
         self._session_compressor = session_compressor
+        self._commit_batcher = CommitBatcher(self._commit_in_background)
 
     def set_dependencies(
         self,
@@ -131,19 +218,43 @@ class SessionService:
             logger.error(f"Failed to delete session {session_id}: {e}")
             raise NotFoundError(session_id, "session")
 
-    async def commit(self, session_id: str, ctx: RequestContext) -> Dict[str, Any]:
+    async def commit(
+        self, session_id: str, ctx: RequestContext, wait: bool = True
+    ) -> Dict[str, Any]:
         """Commit a session (archive messages and extract memories).
 
         Args:
             session_id: Session ID to commit
+            wait: If False, queue the commit on the background batcher and return
+                immediately with ``status="accepted"``
 
         Returns:
             Commit result
         """
         self._ensure_initialized()
+        if wait:
+            return await self._commit_now(session_id, ctx)
+        await self.get(session_id, ctx)
+        await self._commit_batcher.submit(session_id, ctx)
+        return {"session_id": session_id, "status": "accepted"}
+
+    async def _commit_now(self, session_id: str, ctx: RequestContext) -> Dict[str, Any]:
         session = await self.get(session_id, ctx)
         return session.commit()
 
+    async def _commit_in_background(self, session_id: str, ctx: RequestContext) -> Dict[str, Any]:
+        session = await self.get(session_id, ctx)
+        # Session.commit blocks on LLM/storage calls; keep the event loop serving requests
+        return await asyncio.to_thread(session.commit)
+
+    async def flush_commits(self) -> None:
+        """Wait for all background (``wait=False``) commits to finish."""
+        await self._commit_batcher.flush()
+
+    async def close(self) -> None:
+        """Drain background commits and stop the batcher worker."""
+        await self._commit_batcher.close()
+
     async def extract(self, session_id: str, ctx: RequestContext) -> List[Any]:
         """Extract memories from a session.
 
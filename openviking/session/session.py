@@ -7,12 +7,14 @@ Session as Context: Sessions integrated into L0/L1/L2 system.
 
 import json
 import re
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from openviking.message import Message, Part
+from openviking.message.message import _JSON_ENCODER
 from openviking.server.identity import RequestContext, Role
 from openviking.utils.time_utils import get_current_timestamp
 from openviking_cli.session.user_id import UserIdentifier
@@ -87,9 +89,13 @@ class Session:
 
         self._messages: List[Message] = []
         self._usage_records: List[Usage] = []
+        # Distinct used URIs in first-use order (dict as an ordered set)
+        self._used_uris: Dict[str, None] = {}
         self._compression: SessionCompression = SessionCompression()
         self._stats: SessionStats = SessionStats()
         self._loaded = False
+        # Session methods run through run_async, so commits may race across threads
+        self._commit_lock = threading.Lock()
 
         logger.info(f"Session created: {self.session_id} for user {self.user}")
 
@@ -159,6 +165,8 @@ class Session:
             for uri in contexts:
                 usage = Usage(uri=uri, type="context")
                 self._usage_records.append(usage)
+                if uri:
+                    self._used_uris[uri] = None
                 self._stats.contexts_used += 1
                 logger.debug(f"Tracked context usage: {uri}")
 
@@ -171,6 +179,8 @@ class Session:
                 success=skill.get("success", True),
             )
             self._usage_records.append(usage)
+            if usage.uri:
+                self._used_uris[usage.uri] = None
             self._stats.skills_used += 1
             logger.debug(f"Tracked skill usage: {skill.get('uri')}")
 
@@ -180,6 +190,12 @@ class Session:
         parts: List[Part],
     ) -> Message:
         """Add a message."""
+        msg = self._new_message(role, parts)
+        self._append_to_jsonl(msg)
+        return msg
+
+    def _new_message(self, role: str, parts: List[Part]) -> Message:
+        """Append a message in memory and update statistics, without persisting it."""
         msg = Message(
             id=f"msg_{uuid4().hex}",
             role=role,
@@ -192,8 +208,6 @@ class Session:
         if role == "user":
             self._stats.total_turns += 1
         self._stats.total_tokens += len(msg.content) // 4
-
-        self._append_to_jsonl(msg)
         return msg
 
     def update_tool_part(
@@ -219,7 +233,15 @@ class Session:
         self._update_message_in_jsonl()
 
     def commit(self) -> Dict[str, Any]:
-        """Commit session: create archive, extract memories, persist."""
+        """Commit session: create archive, extract memories, persist.
+
+        Commits of one session are serialized; messages added while a commit is
+        running stay in the session for the next commit.
+        """
+        with self._commit_lock:
+            return self._commit()
+
+    def _commit(self) -> Dict[str, Any]:
         result = {
             "session_id": self.session_id,
             "status": "committed",
@@ -233,7 +255,8 @@ class Session:
 
         # 1. Archive current messages
         self._compression.compression_index += 1
-        messages_to_archive = self._messages.copy()
+        # Swap rather than copy-then-clear, so concurrent add_message calls are not lost
+        messages_to_archive, self._messages = self._messages, []
 
         summary = self._generate_archive_summary(messages_to_archive)
         archive_abstract = self._extract_abstract_from_summary(summary)
@@ -249,7 +272,6 @@ class Session:
         self._compression.original_count += len(messages_to_archive)
         result["archived"] = True
 
-        self._messages.clear()
         logger.info(
             f"Archived: {len(messages_to_archive)} messages → history/archive_{self._compression.compression_index:03d}/"
         )
@@ -294,12 +316,29 @@ class Session:
         logger.info(f"Session {self.session_id} committed")
         return result
 
+    def commit_with(
+        self,
+        messages: List[Tuple[str, List[Part]]],
+        contexts: Optional[List[str]] = None,
+        skill: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Add messages, record usage and commit in one step.
+
+        Same result as add_message() for each (role, parts), used() and commit(),
+        but the messages skip the per-message append to messages.jsonl: commit()
+        archives them and rewrites the live message log anyway.
+        """
+        for role, parts in messages:
+            self._new_message(role, parts)
+        self.used(contexts=contexts, skill=skill)
+        return self.commit()
+
     def _update_active_counts(self) -> int:
         """Update active_count for used contexts/skills."""
         if not self._vikingdb_manager:
             return 0
 
-        uris = [usage.uri for usage in self._usage_records if usage.uri]
+        uris = list(self._used_uris)
         try:
             updated = run_async(self._vikingdb_manager.increment_active_count(self.ctx, uris))
         except Exception as e:
@@ -531,7 +570,7 @@ class Session:
         run_async(
             self._viking_fs.write_file(
                 f"{self._session_uri}/tools/{tool_id}/tool.json",
-                json.dumps(tool_data, ensure_ascii=False),
+                _JSON_ENCODER.encode(tool_data),
                 ctx=self.ctx,
             )
         )
@@ -574,12 +613,12 @@ class Session:
             return
 
         viking_fs = self._viking_fs
-        for usage in self._usage_records:
+        for uri in self._used_uris:
             try:
-                run_async(viking_fs.link(self._session_uri, usage.uri, ctx=self.ctx))
-                logger.debug(f"Created relation: {self._session_uri} -> {usage.uri}")
+                run_async(viking_fs.link(self._session_uri, uri, ctx=self.ctx))
+                logger.debug(f"Created relation: {self._session_uri} -> {uri}")
             except Exception as e:
-                logger.warning(f"Failed to create relation to {usage.uri}: {e}")
+                logger.warning(f"Failed to create relation to {uri}: {e}")
 
     # ============= Properties =============
 
@@ -40,7 +40,7 @@ class EmbeddingMsgConverter:
             agent_id = user.get("agent_id", "default")
             from openviking_cli.session.user_id import UserIdentifier
 
-            owner_user = UserIdentifier(account, user_id, agent_id)
+            owner_user = UserIdentifier.of(account, user_id, agent_id)
             if uri.startswith("viking://agent/"):
                 context_data["owner_space"] = owner_user.agent_space_name()
             elif uri.startswith("viking://user/") or uri.startswith("viking://session/"):
@@ -101,6 +101,7 @@ class NamedQueue:
         name: str,
         enqueue_hook: Optional[EnqueueHookBase] = None,
         dequeue_handler: Optional[DequeueHandlerBase] = None,
+        activity: Optional[threading.Event] = None,
     ):
         self.name = name
         self.path = f"{mount_point}/{name}"
@@ -115,6 +116,8 @@ class NamedQueue:
         self._processed = 0
         self._error_count = 0
         self._errors: List[QueueError] = []
+        # Set whenever a message finishes, so waiters can re-check status without polling
+        self._activity = activity
 
         # Inject callbacks to handler
         if self._dequeue_handler:
@@ -133,6 +136,8 @@ class NamedQueue:
         with self._lock:
             self._in_progress -= 1
             self._processed += 1
+        if self._activity is not None:
+            self._activity.set()
 
     def _on_process_error(self, error_msg: str, data: Optional[Dict[str, Any]] = None) -> None:
         """Called on processing failure."""
@@ -148,6 +153,8 @@ class NamedQueue:
             )
             if len(self._errors) > self.MAX_ERRORS:
                 self._errors = self._errors[-self.MAX_ERRORS :]
+        if self._activity is not None:
+            self._activity.set()
 
     async def get_status(self) -> QueueStatus:
         """Get queue status."""
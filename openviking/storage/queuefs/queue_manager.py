@@ -88,6 +88,8 @@ class QueueManager:
         self._queue_threads: Dict[str, threading.Thread] = {}
         self._queue_stop_events: Dict[str, threading.Event] = {}
         self._poll_interval = 0.2
+        # Shared by all queues; set when any message finishes processing
+        self._activity = threading.Event()
 
         atexit.register(self.stop)
         logger.info(
@@ -293,6 +295,7 @@ class QueueManager:
                     name,
                     enqueue_hook=enqueue_hook,
                     dequeue_handler=dequeue_handler,
+                    activity=self._activity,
                 )
             elif name == self.SEMANTIC:
                 self._queues[name] = SemanticQueue(
@@ -301,6 +304,7 @@ class QueueManager:
                     name,
                     enqueue_hook=enqueue_hook,
                     dequeue_handler=dequeue_handler,
+                    activity=self._activity,
                 )
             else:
                 self._queues[name] = NamedQueue(
@@ -309,6 +313,7 @@ class QueueManager:
                     name,
                     enqueue_hook=enqueue_hook,
                     dequeue_handler=dequeue_handler,
+                    activity=self._activity,
                 )
             if self._started:
                 self._start_queue_worker(self._queues[name])
@@ -371,8 +376,12 @@ class QueueManager:
         """Wait for completion and return final status."""
         start = time.time()
         while True:
+            # Clear before checking so a completion racing with the check still wakes us
+            self._activity.clear()
             if await self.is_all_complete(queue_name):
                 return await self.check_status(queue_name)
             if timeout and (time.time() - start) > timeout:
                 raise TimeoutError(f"Queue processing not complete after {timeout}s")
-            await asyncio.sleep(poll_interval)
+            # Wake as soon as a worker finishes a message. poll_interval stays as the upper
+            # bound: pending counts live in AGFS and can change without a callback.
+            await asyncio.to_thread(self._activity.wait, poll_interval)
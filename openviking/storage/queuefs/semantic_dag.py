@@ -3,8 +3,8 @@
 """Semantic DAG executor with event-driven lazy dispatch."""
 
 import asyncio
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
 
 from openviking.server.identity import RequestContext
 from openviking.storage.viking_fs import get_viking_fs
@@ -13,8 +13,11 @@ from openviking_cli.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of summarized files sent to vectorization in a single call.
+_VECTORIZE_BATCH_SIZE = 32
 
-@dataclass
+
+@dataclass(slots=True)
 class DirNode:
     """Directory node state for DAG execution."""
 
@@ -26,12 +29,14 @@ class DirNode:
     file_summaries: List[Optional[Dict[str, str]]]
     children_abstracts: List[Optional[Dict[str, str]]]
     pending: int
+    files_remaining: int = 0
+    vectorize_buffer: List[Tuple[str, Dict[str, str]]] = field(default_factory=list)
     dispatched: bool = False
     overview_scheduled: bool = False
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
 
-@dataclass
+@dataclass(slots=True)
 class DagStats:
     total_nodes: int = 0
     pending_nodes: int = 0
@@ -90,6 +95,7 @@ class SemanticDagExecutor:
                 file_summaries=[None] * len(file_paths),
                 children_abstracts=[None] * len(children_dirs),
                 pending=pending,
+                files_remaining=len(file_paths),
                 dispatched=True,
             )
             self._nodes[dir_uri] = node
@@ -100,12 +106,11 @@ class SemanticDagExecutor:
                 self._schedule_overview(dir_uri)
                 return
 
+            # File nodes are scheduled immediately (pending -> in_progress), so
+            # account for the whole level at once instead of per file.
+            self._stats.total_nodes += len(file_paths)
+            self._stats.in_progress_nodes += len(file_paths)
             for file_path in file_paths:
-                self._stats.total_nodes += 1
-                # File nodes are scheduled immediately: pending -> in_progress.
-                self._stats.pending_nodes += 1
-                self._stats.pending_nodes = max(0, self._stats.pending_nodes - 1)
-                self._stats.in_progress_nodes += 1
                 asyncio.create_task(self._file_summary_task(dir_uri, file_path))
 
             for child_uri in children_dirs:
@@ -127,13 +132,15 @@ class SemanticDagExecutor:
 
         children_dirs: List[str] = []
         file_paths: List[str] = []
+        base = VikingURI(uri)
 
         for entry in entries:
             name = entry.get("name", "")
-            if not name or name.startswith(".") or name in [".", ".."]:
+            if not name or name.startswith("."):
                 continue
 
-            item_uri = VikingURI(uri).join(name).uri
+            # VikingFS.ls already resolves each entry's URI; only rebuild it if absent
+            item_uri = entry.get("uri") or base.join(name).uri
             if entry.get("isDir", False):
                 children_dirs.append(item_uri)
             else:
@@ -156,20 +163,41 @@ class SemanticDagExecutor:
             self._stats.in_progress_nodes = max(0, self._stats.in_progress_nodes - 1)
 
         await self._on_file_done(parent_uri, file_path, summary_dict)
+        await self._buffer_file_vectorization(parent_uri, file_path, summary_dict)
+
+    async def _buffer_file_vectorization(
+        self, parent_uri: str, file_path: str, summary_dict: Dict[str, str]
+    ) -> None:
+        """Queue a summarized file and flush the directory's batch when it is full.
+
+        Files are vectorized without waiting for the overview; batches are flushed
+        at ``_VECTORIZE_BATCH_SIZE`` items or once every file in the directory is done.
+        """
+        node = self._nodes.get(parent_uri)
+        if node is None:
+            batch = [(file_path, summary_dict)]
+        else:
+            async with node.lock:
+                node.vectorize_buffer.append((file_path, summary_dict))
+                node.files_remaining -= 1
+                if len(node.vectorize_buffer) < _VECTORIZE_BATCH_SIZE and node.files_remaining > 0:
+                    return
+                batch, node.vectorize_buffer = node.vectorize_buffer, []
 
-        # Vectorize file as soon as summary is ready to avoid waiting for overview.
         try:
             asyncio.create_task(
-                self._processor._vectorize_single_file(
+                self._processor._vectorize_files_batch(
                     parent_uri=parent_uri,
                     context_type=self._context_type,
-                    file_path=file_path,
-                    summary_dict=summary_dict,
+                    items=batch,
                     ctx=self._ctx,
                 )
             )
         except Exception as e:
-            logger.error(f"Failed to schedule vectorization for {file_path}: {e}", exc_info=True)
+            logger.error(
+                f"Failed to schedule vectorization for {len(batch)} files in {parent_uri}: {e}",
+                exc_info=True,
+            )
 
     async def _on_file_done(
         self, parent_uri: str, file_path: str, summary_dict: Dict[str, str]
@@ -282,12 +310,8 @@ class SemanticDagExecutor:
         await self._on_child_done(parent_uri, dir_uri, abstract)
 
     def get_stats(self) -> DagStats:
-        return DagStats(
-            total_nodes=self._stats.total_nodes,
-            pending_nodes=self._stats.pending_nodes,
-            in_progress_nodes=self._stats.in_progress_nodes,
-            done_nodes=self._stats.done_nodes,
-        )
+        """Snapshot of the running counters (a copy, safe to hand to observers)."""
+        return replace(self._stats)
 
 
 if False:  # pragma: no cover - for type checkers only
@@ -74,7 +74,7 @@ class SemanticProcessor(DequeueHandlerBase):
     def _ctx_from_semantic_msg(msg: SemanticMsg) -> RequestContext:
         role = Role(msg.role) if msg.role in {r.value for r in Role} else Role.ROOT
         return RequestContext(
-            user=UserIdentifier(msg.account_id, msg.user_id, msg.agent_id),
+            user=UserIdentifier.of(msg.account_id, msg.user_id, msg.agent_id),
             role=role,
         )
 
@@ -268,13 +268,13 @@ class SemanticProcessor(DequeueHandlerBase):
     async def _collect_children_abstracts(self, children_uris: List[str]) -> List[Dict[str, str]]:
         """Collect .abstract.md from subdirectories."""
         viking_fs = get_viking_fs()
-        results = []
-
-        for child_uri in children_uris:
-            abstract = await viking_fs.abstract(child_uri, ctx=self._current_ctx)
-            dir_name = child_uri.split("/")[-1]
-            results.append({"name": dir_name, "abstract": abstract})
-        return results
+        abstracts = await asyncio.gather(
+            *(viking_fs.abstract(child_uri, ctx=self._current_ctx) for child_uri in children_uris)
+        )
+        return [
+            {"name": child_uri.split("/")[-1], "abstract": abstract}
+            for child_uri, abstract in zip(children_uris, abstracts)
+        ]
 
     async def _generate_file_summaries(
         self,
@@ -287,8 +287,14 @@ class SemanticProcessor(DequeueHandlerBase):
         if not file_paths:
             return []
 
+        # One semaphore for the whole directory; without it every file would get its own
+        # and the gather below would issue all LLM calls at once.
+        llm_sem = asyncio.Semaphore(self.max_concurrent_llm)
+
         async def generate_one_summary(file_path: str) -> Dict[str, str]:
-            summary = await self._generate_single_file_summary(file_path, ctx=self._current_ctx)
+            summary = await self._generate_single_file_summary(
+                file_path, llm_sem=llm_sem, ctx=self._current_ctx
+            )
             if enqueue_files and context_type and parent_uri:
                 try:
                     await self._vectorize_single_file(
@@ -420,27 +426,41 @@ class SemanticProcessor(DequeueHandlerBase):
             return await self._generate_text_summary(file_path, file_name, llm_sem, ctx=ctx)
 
     def _extract_abstract_from_overview(self, overview_content: str) -> str:
-        """Extract abstract from overview.md."""
-        lines = overview_content.split("\n")
+        """Extract abstract from overview.md.
 
-        # Skip header lines (starting with #)
-        content_lines = []
+        Skips the leading header lines (starting with #) and keeps the stripped,
+        non-empty lines up to the first ## section. Lines are scanned lazily, so
+        the remainder of a long overview is never split.
+        """
+        content_lines: List[str] = []
         in_header = True
 
-        for line in lines:
-            if in_header and line.startswith("#"):
-                continue
-            elif in_header and line.strip():
+        start = 0
+        end = len(overview_content)
+        while start <= end:
+            stop = overview_content.find("\n", start)
+            if stop == -1:
+                stop = end
+            line = overview_content[start:stop]
+            start = stop + 1
+
+            if in_header:
+                if line.startswith("#"):
+                    continue
+                stripped = line.strip()
+                if not stripped:
+                    continue
                 in_header = False
-
-            if not in_header:
+            elif line.startswith("##"):
                 # Stop at first ##
-                if line.startswith("##"):
-                    break
-                if line.strip():
-                    content_lines.append(line.strip())
+                break
+            else:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+            content_lines.append(stripped)
 
-        return "\n".join(content_lines).strip()
+        return "\n".join(content_lines)
 
     async def _generate_overview(
         self,
@@ -556,6 +576,30 @@ class SemanticProcessor(DequeueHandlerBase):
                 ctx=ctx,
             )
 
+    async def _vectorize_files_batch(
+        self,
+        parent_uri: str,
+        context_type: str,
+        items: List[Tuple[str, Dict[str, str]]],
+        ctx: Optional[RequestContext] = None,
+    ) -> None:
+        """Vectorize a batch of (file_path, summary_dict) pairs from one directory.
+
+        Default implementation delegates to ``_vectorize_single_file`` per item;
+        subclasses backed by a remote store can override it to send one request.
+        """
+        for file_path, summary_dict in items:
+            try:
+                await self._vectorize_single_file(
+                    parent_uri=parent_uri,
+                    context_type=context_type,
+                    file_path=file_path,
+                    summary_dict=summary_dict,
+                    ctx=ctx,
+                )
+            except Exception as e:
+                logger.error(f"Failed to vectorize file {file_path}: {e}", exc_info=True)
+
     async def _vectorize_single_file(
         self,
         parent_uri: str,
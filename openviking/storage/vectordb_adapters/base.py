@@ -375,7 +375,7 @@ class CollectionAdapter(ABC):
         ids: list[str] = []
         for item in records:
             record = self._normalize_record_for_write(item)
-            record_id = record.get("id") or str(uuid.uuid4())
+            record_id = record.get("id") or uuid.uuid4().hex
             record["id"] = record_id
             ids.append(record_id)
             normalized.append(record)
@@ -403,6 +403,19 @@ class CollectionAdapter(ABC):
                     records.append(self._normalize_record_for_read(record))
         return records
 
+    def exists(self, id: str) -> bool:
+        """Primary-key existence check that skips record normalization.
+
+        fetch_data has no field projection, so backends still return the full
+        record; only the per-record copy and URI decoding are saved.
+        """
+        result = self.get_collection().fetch_data([id])
+        if isinstance(result, FetchDataInCollectionResult):
+            return bool(result.items)
+        if isinstance(result, dict):
+            return any(item.get("id") for item in result.get("fetch", []))
+        return False
+
     def query(
         self,
         *,
@@ -16,9 +16,11 @@ import asyncio
 import contextvars
 import hashlib
 import json
+import re
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import PurePath
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
@@ -36,6 +38,19 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Line boundaries recognized by str.splitlines
+_LINE_BREAK_RE = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+_VIKING_PREFIX = "viking://"
+_VIKING_PREFIX_LEN = len(_VIKING_PREFIX)
+
+# Scopes readable by every account member / scopes whose space is the user space
+_PUBLIC_SCOPES = frozenset({"resources", "temp", "transactions"})
+_USER_SPACE_SCOPES = frozenset({"user", "session"})
+
+# AGFS HandleFS open flags: O_WRONLY | O_APPEND | O_CREATE
+_AGFS_APPEND_FLAGS = 1 | 8 | 16
+
 
 # ========== Dataclass ==========
 
@@ -173,6 +188,8 @@ class VikingFS:
         self._bound_ctx: contextvars.ContextVar[Optional[RequestContext]] = contextvars.ContextVar(
             "vikingfs_bound_ctx", default=None
         )
+        # dir_path -> ((modTime, size), parsed .relations.json entries)
+        self._relations_cache: Dict[str, tuple[tuple[Any, Any], List[RelationEntry]]] = {}
 
     @staticmethod
     def _default_ctx() -> RequestContext:
@@ -213,10 +230,8 @@ class VikingFS:
         result = self.agfs.read(path, offset, size)
         if isinstance(result, bytes):
             return result
-        elif result is not None and hasattr(result, "content"):
-            return result.content
-        else:
-            return b""
+        content = getattr(result, "content", None)
+        return content if content is not None else b""
 
     async def write(
         self,
@@ -845,11 +860,17 @@ class VikingFS:
     _MAX_FILENAME_BYTES = 255
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _shorten_component(component: str, max_bytes: int = 255) -> str:
-        """Shorten a path component if its UTF-8 encoding exceeds max_bytes."""
-        if len(component.encode("utf-8")) <= max_bytes:
+        """Shorten a path component if its UTF-8 encoding exceeds max_bytes.
+
+        Every rm/delete of the same URI maps its components again, so the
+        SHA-256 suffix is memoized per (component, max_bytes).
+        """
+        encoded = component.encode("utf-8")
+        if len(encoded) <= max_bytes:
             return component
-        hash_suffix = hashlib.sha256(component.encode("utf-8")).hexdigest()[:8]
+        hash_suffix = hashlib.sha256(encoded).hexdigest()[:8]
         # Trim to fit within max_bytes after adding hash suffix
         prefix = component
         target = max_bytes - len(f"_{hash_suffix}".encode("utf-8"))
@@ -857,8 +878,8 @@ class VikingFS:
             prefix = prefix[:-1]
         return f"{prefix}_{hash_suffix}"
 
-    _USER_STRUCTURE_DIRS = {"memories"}
-    _AGENT_STRUCTURE_DIRS = {"memories", "skills", "instructions", "workspaces"}
+    _USER_STRUCTURE_DIRS = frozenset({"memories"})
+    _AGENT_STRUCTURE_DIRS = frozenset({"memories", "skills", "instructions", "workspaces"})
 
     def _uri_to_path(self, uri: str, ctx: Optional[RequestContext] = None) -> str:
         """Map virtual URI to account-isolated AGFS path.
@@ -868,7 +889,7 @@ class VikingFS:
         """
         real_ctx = self._ctx_or_default(ctx)
         account_id = real_ctx.account_id
-        remainder = uri[len("viking://") :].strip("/") if uri.startswith("viking://") else uri
+        remainder = uri[_VIKING_PREFIX_LEN:].strip("/") if uri.startswith(_VIKING_PREFIX) else uri
         if not remainder:
             return f"/local/{account_id}"
 
@@ -915,16 +936,19 @@ class VikingFS:
         else:
             return f"viking://{path}"
 
-    def _extract_space_from_uri(self, uri: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _extract_space_from_uri(uri: str) -> Optional[str]:
         """Extract space segment from URI if present.
 
         URIs are WYSIWYG: viking://{scope}/{space}/...
         For user/agent, the second segment is space unless it's a known structure dir.
         For session, the second segment is always space (when 3+ parts).
+        Pure function of the URI string, so results are memoized.
         """
-        if not uri.startswith("viking://"):
+        if not uri.startswith(_VIKING_PREFIX):
             return None
-        parts = [p for p in uri[len("viking://") :].strip("/").split("/") if p]
+        parts = [p for p in uri[_VIKING_PREFIX_LEN:].strip("/").split("/") if p]
         if len(parts) < 2:
             return None
         scope = parts[0]
@@ -932,9 +956,9 @@ class VikingFS:
         # Treat scope-root metadata files as not having a tenant space segment.
         if len(parts) == 2 and second in {".abstract.md", ".overview.md"}:
             return None
-        if scope == "user" and second not in self._USER_STRUCTURE_DIRS:
+        if scope == "user" and second not in VikingFS._USER_STRUCTURE_DIRS:
             return second
-        if scope == "agent" and second not in self._AGENT_STRUCTURE_DIRS:
+        if scope == "agent" and second not in VikingFS._AGENT_STRUCTURE_DIRS:
             return second
         if scope == "session" and len(parts) >= 2:
             return second
@@ -944,15 +968,19 @@ class VikingFS:
         """Check whether a URI is visible/accessible under current request context."""
         if ctx.role == Role.ROOT:
             return True
-        if not uri.startswith("viking://"):
+        if not uri.startswith(_VIKING_PREFIX):
             uri = VikingURI.normalize(uri)
 
-        parts = [p for p in uri[len("viking://") :].strip("/").split("/") if p]
-        if not parts:
+        # Find the scope segment in place instead of splitting the whole URI
+        start = _VIKING_PREFIX_LEN
+        uri_len = len(uri)
+        while start < uri_len and uri[start] == "/":
+            start += 1
+        if start == uri_len:
             return True
-
-        scope = parts[0]
-        if scope in {"resources", "temp", "transactions"}:
+        end = uri.find("/", start)
+        scope = uri[start:] if end == -1 else uri[start:end]
+        if scope in _PUBLIC_SCOPES:
             return True
         if scope == "_system":
             return False
@@ -961,7 +989,7 @@ class VikingFS:
         if space is None:
             return True
 
-        if scope in {"user", "session"}:
+        if scope in _USER_SPACE_SCOPES:
             return space == ctx.user.user_space_name()
         if scope == "agent":
             return space == ctx.user.agent_space_name()
@@ -971,60 +999,59 @@ class VikingFS:
         """Handle AGFSClient read return types consistently."""
         if isinstance(result, bytes):
             return result
-        elif result is None:
+        if result is None:
+            return b""
+        content = getattr(result, "content", None)
+        if isinstance(content, (bytes, bytearray)):
+            return bytes(content)
+        if content is not None:
+            return content
+        if isinstance(result, str):
+            return result.encode("utf-8")
+        # Try to convert to bytes
+        try:
+            return str(result).encode("utf-8")
+        except Exception:
             return b""
-        elif hasattr(result, "content") and result.content is not None:
-            return result.content
-        else:
-            # Try to convert to bytes
-            try:
-                return str(result).encode("utf-8")
-            except Exception:
-                return b""
 
     def _decode_bytes(self, data: bytes) -> str:
-        """Robustly decode bytes to string."""
+        """Robustly decode bytes to string.
+
+        BOMs pick the codec directly. Otherwise UTF-8 is tried, then GBK, then
+        latin-1, so BOM-less non-UTF-8 data may be scanned up to three times;
+        the C codecs still beat a byte-level sniff written in Python.
+        """
         if not data:
             return ""
+        if data[:3] == b"\xef\xbb\xbf":
+            return data.decode("utf-8-sig", errors="replace")
+        if data[:2] in (b"\xff\xfe", b"\xfe\xff"):
+            return data.decode("utf-16", errors="replace")
         try:
             return data.decode("utf-8")
         except UnicodeDecodeError:
-            try:
-                # Try common encoding for Windows/legacy files in China
-                return data.decode("gbk")
-            except UnicodeDecodeError:
-                try:
-                    return data.decode("latin-1")
-                except UnicodeDecodeError:
-                    return data.decode("utf-8", errors="replace")
+            pass
+        try:
+            # Try common encoding for Windows/legacy files in China
+            return data.decode("gbk")
+        except UnicodeDecodeError:
+            # latin-1 maps every byte, so this never fails
+            return data.decode("latin-1")
 
     def _handle_agfs_content(self, result: Union[bytes, Any, None]) -> str:
         """Handle AGFSClient content return types consistently."""
-        if isinstance(result, bytes):
-            return self._decode_bytes(result)
-        elif hasattr(result, "content") and result.content is not None:
-            return self._decode_bytes(result.content)
-        elif result is None:
+        if result is None:
             return ""
-        else:
-            # Try to convert to string
-            try:
-                return str(result)
-            except Exception:
-                return ""
-        """Handle AGFSClient content return types consistently."""
         if isinstance(result, bytes):
-            return result.decode("utf-8")
-        elif hasattr(result, "content"):
-            return result.content.decode("utf-8")
-        elif result is None:
+            return self._decode_bytes(result)
+        content = getattr(result, "content", None)
+        if content is not None:
+            return self._decode_bytes(content)
+        # Try to convert to string
+        try:
+            return str(result)
+        except Exception:
             return ""
-        else:
-            # Try to convert to string
-            try:
-                return str(result)
-            except Exception:
-                return ""
 
     def _infer_context_type(self, uri: str):
         """Infer context_type from URI. Returns None when ambiguous."""
@@ -1043,26 +1070,41 @@ class VikingFS:
     async def _collect_uris(
         self, path: str, recursive: bool, ctx: Optional[RequestContext] = None
     ) -> List[str]:
-        """Recursively collect all URIs (for rm/mv)."""
-        uris = []
+        """Recursively collect all URIs (for rm/mv).
 
-        async def _collect(p: str):
+        Sibling directories are walked concurrently; the semaphore only guards
+        the AGFS ls call so deep trees cannot deadlock on it.
+        """
+        semaphore = asyncio.Semaphore(32)
+
+        async def _collect(p: str) -> List[str]:
             try:
-                for entry in self._ls_entries(p):
-                    name = entry.get("name", "")
-                    if name in [".", ".."]:
-                        continue
-                    full_path = f"{p}/{name}".replace("//", "/")
-                    if entry.get("isDir"):
-                        if recursive:
-                            await _collect(full_path)
-                    else:
-                        uris.append(self._path_to_uri(full_path, ctx=ctx))
+                async with semaphore:
+                    entries = await asyncio.to_thread(self._ls_entries, p)
             except Exception:
-                pass
+                return []
 
-        await _collect(path)
-        return uris
+            uris = []
+            dir_children = []
+            # Only the join point can produce "//", so decide the separator once
+            dir_prefix = p if p.endswith("/") else p + "/"
+            for entry in entries:
+                name = entry.get("name", "")
+                if name in [".", ".."]:
+                    continue
+                full_path = dir_prefix + name
+                if entry.get("isDir"):
+                    if recursive:
+                        dir_children.append(full_path)
+                else:
+                    uris.append(self._path_to_uri(full_path, ctx=ctx))
+
+            if dir_children:
+                for child_uris in await asyncio.gather(*[_collect(c) for c in dir_children]):
+                    uris.extend(child_uris)
+            return uris
+
+        return await _collect(path)
 
     async def _delete_from_vector_store(
         self, uris: List[str], ctx: Optional[RequestContext] = None
@@ -1100,36 +1142,33 @@ class VikingFS:
 
         old_base_uri = self._path_to_uri(old_base, ctx=ctx)
         new_base_uri = self._path_to_uri(new_base, ctx=ctx)
+        real_ctx = self._ctx_or_default(ctx)
 
-        for uri in uris:
-            try:
-                records = await vector_store.get_context_by_uri(
-                    account_id=self._ctx_or_default(ctx).account_id,
-                    uri=uri,
-                    limit=1,
-                )
-
-                if not records or "id" not in records[0]:
-                    continue
-
-                record = records[0]
-
-                new_uri = uri.replace(old_base_uri, new_base_uri, 1)
+        try:
+            records = await vector_store.get_contexts_by_uris(real_ctx.account_id, uris)
+        except Exception as e:
+            logger.warning(f"[VikingFS] Failed to look up moved URIs in vector store: {e}")
+            return
 
-                old_parent_uri = record.get("parent_uri", "")
-                new_parent_uri = (
-                    old_parent_uri.replace(old_base_uri, new_base_uri, 1) if old_parent_uri else ""
-                )
+        updated = []
+        for uri in uris:
+            record = records.get(uri)
+            if not record or "id" not in record:
+                continue
+            new_uri = uri.replace(old_base_uri, new_base_uri, 1)
+            old_parent_uri = record.get("parent_uri", "")
+            new_parent_uri = (
+                old_parent_uri.replace(old_base_uri, new_base_uri, 1) if old_parent_uri else ""
+            )
+            updated.append({**record, "uri": new_uri, "parent_uri": new_parent_uri})
 
-                await vector_store.update_uri_mapping(
-                    ctx=self._ctx_or_default(ctx),
-                    uri=uri,
-                    new_uri=new_uri,
-                    new_parent_uri=new_parent_uri,
-                )
-                logger.info(f"[VikingFS] Updated URI: {uri} -> {new_uri}")
-            except Exception as e:
-                logger.warning(f"[VikingFS] Failed to update {uri} in vector store: {e}")
+        if not updated:
+            return
+        try:
+            await vector_store.upsert_many(updated)
+            logger.info(f"[VikingFS] Updated {len(updated)} URIs: {old_base_uri} -> {new_base_uri}")
+        except Exception as e:
+            logger.warning(f"[VikingFS] Failed to update moved URIs in vector store: {e}")
 
     def _get_vector_store(self) -> Optional["VikingVectorIndexBackend"]:
         """Get vector store instance."""
@@ -1160,8 +1199,24 @@ class VikingFS:
     # ========== Relation Table Internal Methods ==========
 
     async def _read_relation_table(self, dir_path: str) -> List[RelationEntry]:
-        """Read .relations.json."""
+        """Read .relations.json.
+
+        Parsed entries are cached per directory and reused while the file's
+        (modTime, size) stat signature is unchanged. Callers get copies, so
+        mutating the returned entries never touches the cache.
+        """
         table_path = f"{dir_path}/.relations.json"
+        try:
+            info = self.agfs.stat(table_path)
+            signature = (info.get("modTime"), info.get("size"))
+        except Exception:
+            self._relations_cache.pop(dir_path, None)
+            return []
+
+        cached = self._relations_cache.get(dir_path)
+        if cached is not None and signature[0] is not None and cached[0] == signature:
+            return [self._copy_relation_entry(e) for e in cached[1]]
+
         try:
             content = self._handle_agfs_read(self.agfs.read(table_path))
             data = json.loads(content.decode("utf-8"))
@@ -1183,17 +1238,24 @@ class VikingFS:
                 for _user, entry_list in user_dict.items():
                     for entry_data in entry_list:
                         entries.append(RelationEntry.from_dict(entry_data))
-        return entries
+
+        self._relations_cache[dir_path] = (signature, entries)
+        return [self._copy_relation_entry(e) for e in entries]
+
+    @staticmethod
+    def _copy_relation_entry(entry: RelationEntry) -> RelationEntry:
+        return RelationEntry(
+            id=entry.id, uris=list(entry.uris), reason=entry.reason, created_at=entry.created_at
+        )
 
     async def _write_relation_table(self, dir_path: str, entries: List[RelationEntry]) -> None:
         """Write .relations.json."""
         # Use flat list format
         data = [entry.to_dict() for entry in entries]
 
-        content = json.dumps(data, ensure_ascii=False, indent=2)
+        content = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
         table_path = f"{dir_path}/.relations.json"
-        if isinstance(content, str):
-            content = content.encode("utf-8")
+        self._relations_cache.pop(dir_path, None)
         self.agfs.write(table_path, content)
 
     # ========== Batch Read (backward compatible) ==========
@@ -1258,9 +1320,29 @@ class VikingFS:
         text = self._handle_agfs_content(content)
         if offset == 0 and limit == -1:
             return text
-        lines = text.splitlines(keepends=True)
-        sliced = lines[offset:] if limit == -1 else lines[offset : offset + limit]
-        return "".join(sliced)
+        return self._slice_lines(text, offset, limit)
+
+    @staticmethod
+    def _slice_lines(text: str, offset: int, limit: int) -> str:
+        """Return lines [offset, offset + limit) of text, keeping line endings.
+
+        Walks line boundaries (the same ones str.splitlines uses) instead of
+        materializing a list of lines.
+        """
+        if limit == 0:
+            return ""
+        stop = None if limit == -1 else offset + limit
+        start = 0 if offset == 0 else None
+        if start is not None and stop is None:
+            return text
+        for index, match in enumerate(_LINE_BREAK_RE.finditer(text), 1):
+            if index == offset:
+                start = match.end()
+                if stop is None:
+                    break
+            elif index == stop:
+                return text[start : match.end()]
+        return "" if start is None else text[start:]
 
     async def read_file_bytes(
         self,
@@ -1298,20 +1380,46 @@ class VikingFS:
         path = self._uri_to_path(uri, ctx=ctx)
 
         try:
-            existing = ""
+            await self._ensure_parent_dirs(path)
+            data = content.encode("utf-8")
+            if self._append_via_handle(path, data):
+                return
+
+            existing_bytes = b""
             try:
                 existing_bytes = self._handle_agfs_read(self.agfs.read(path))
-                existing = self._decode_bytes(existing_bytes)
+                # Normalize legacy encodings to UTF-8 before appending
+                existing_bytes.decode("utf-8")
+            except UnicodeDecodeError:
+                existing_bytes = self._decode_bytes(existing_bytes).encode("utf-8")
             except Exception:
                 pass
 
-            await self._ensure_parent_dirs(path)
-            self.agfs.write(path, (existing + content).encode("utf-8"))
+            self.agfs.write(path, b"".join((existing_bytes, data)))
 
         except Exception as e:
             logger.error(f"[VikingFS] Failed to append to file {uri}: {e}")
             raise IOError(f"Failed to append to file {uri}: {e}")
 
+    def _append_via_handle(self, path: str, data: bytes) -> bool:
+        """Append data through an O_APPEND file handle.
+
+        Returns False when the backend cannot open an append handle, so the
+        caller can fall back to read-modify-write. Errors after the handle is
+        open are raised, since part of the data may already be written.
+        """
+        open_handle = getattr(self.agfs, "open_handle", None)
+        if open_handle is None:
+            return False
+        try:
+            handle = open_handle(path, flags=_AGFS_APPEND_FLAGS)
+        except Exception as e:
+            logger.debug(f"[VikingFS] Append handle unavailable for {path}: {e}")
+            return False
+        with handle:
+            handle.write(data)
+        return True
+
     async def ls(
         self,
         uri: str,
@@ -1362,6 +1470,7 @@ class VikingFS:
             raise FileNotFoundError(f"Failed to list {uri}: {e}")
         # basic info
         now = datetime.now()
+        dir_prefix = path if path.endswith("/") else path + "/"
         all_entries = []
         for entry in entries:
             if len(all_entries) >= node_limit:
@@ -1376,7 +1485,7 @@ class VikingFS:
                 # 保持时间部分最多 26 位 (YYYY-MM-DDTHH:MM:SS.mmmmmm)
                 raw_time = parts[0][:26] + "+" + parts[1]
             new_entry = {
-                "uri": self._path_to_uri(f"{path}/{name}", ctx=ctx),
+                "uri": self._path_to_uri(dir_prefix + name, ctx=ctx),
                 "size": entry.get("size", 0),
                 "isDir": entry.get("isDir", False),
                 "modTime": format_simplified(parse_iso_datetime(raw_time), now),
@@ -1406,13 +1515,14 @@ class VikingFS:
         try:
             entries = self._ls_entries(path)
             # AGFS returns read-only structure, need to create new dict
+            dir_prefix = path if path.endswith("/") else path + "/"
             all_entries = []
             for entry in entries:
                 if len(all_entries) >= node_limit:
                     break
                 name = entry.get("name", "")
                 new_entry = dict(entry)  # Copy original data
-                new_entry["uri"] = self._path_to_uri(f"{path}/{name}", ctx=ctx)
+                new_entry["uri"] = self._path_to_uri(dir_prefix + name, ctx=ctx)
                 if not self._is_accessible(new_entry["uri"], real_ctx):
                     continue
                 if entry.get("isDir"):
@@ -1436,11 +1546,41 @@ class VikingFS:
         self._ensure_access(to_uri, ctx)
         from_path = self._uri_to_path(from_uri, ctx=ctx)
         to_path = self._uri_to_path(to_uri, ctx=ctx)
-        content = self.agfs.read(from_path)
         await self._ensure_parent_dirs(to_path)
-        self.agfs.write(to_path, content)
+        try:
+            # Server-side rename: metadata only, no bytes copied
+            await asyncio.to_thread(self.agfs.mv, from_path, to_path)
+            return
+        except Exception as e:
+            logger.debug(f"[VikingFS] rename {from_path} -> {to_path} failed, copying: {e}")
+
+        src_size = self.agfs.stat(from_path).get("size")
+        # The chunk generator is one-shot, so a client-side retry would resend a
+        # drained iterator; fail the move instead and leave the source in place.
+        await asyncio.to_thread(
+            self.agfs.write, to_path, self._iter_file_chunks(from_path), max_retries=0
+        )
+        dst_size = self.agfs.stat(to_path).get("size")
+        if dst_size != src_size:
+            raise IOError(
+                f"Incomplete copy {from_path} -> {to_path}: wrote {dst_size} of {src_size} bytes"
+            )
         self.agfs.rm(from_path)
 
+    _COPY_CHUNK_BYTES = 4 * 1024 * 1024
+
+    def _iter_file_chunks(self, path: str):
+        """Yield file content in _COPY_CHUNK_BYTES pieces via ranged reads."""
+        offset = 0
+        while True:
+            chunk = self._handle_agfs_read(self.agfs.read(path, offset, self._COPY_CHUNK_BYTES))
+            if not chunk:
+                return
+            yield chunk
+            if len(chunk) < self._COPY_CHUNK_BYTES:
+                return
+            offset += len(chunk)
+
     # ========== Temp File Operations (backward compatible) ==========
 
     def create_temp_uri(self) -> str:
@@ -1448,19 +1588,42 @@ class VikingFS:
         return VikingURI.create_temp_uri()
 
     async def delete_temp(self, temp_uri: str, ctx: Optional[RequestContext] = None) -> None:
-        """Delete temp directory and its contents."""
+        """Delete temp directory and its contents.
+
+        Issues a single recursive rm; backends that reject it fall back to a
+        concurrent per-entry walk.
+        """
         path = self._uri_to_path(temp_uri, ctx=ctx)
         try:
-            for entry in self._ls_entries(path):
+            await asyncio.to_thread(self.agfs.rm, path, recursive=True)
+            return
+        except Exception as e:
+            logger.debug(f"[VikingFS] Recursive rm of {path} failed, deleting per entry: {e}")
+
+        semaphore = asyncio.Semaphore(32)
+
+        async def _rm(p: str) -> None:
+            async with semaphore:
+                await asyncio.to_thread(self.agfs.rm, p)
+
+        async def _delete_tree(p: str) -> None:
+            async with semaphore:
+                entries = await asyncio.to_thread(self._ls_entries, p)
+            tasks = []
+            for entry in entries:
                 name = entry.get("name", "")
                 if name in [".", ".."]:
                     continue
-                entry_path = f"{path}/{name}"
+                entry_path = f"{p}/{name}"
                 if entry.get("isDir"):
-                    await self.delete_temp(f"{temp_uri}/{name}", ctx=ctx)
+                    tasks.append(_delete_tree(entry_path))
                 else:
-                    self.agfs.rm(entry_path)
-            self.agfs.rm(path)
+                    tasks.append(_rm(entry_path))
+            await asyncio.gather(*tasks)
+            await _rm(p)
+
+        try:
+            await _delete_tree(path)
         except Exception as e:
             logger.warning(f"[VikingFS] Failed to delete temp {temp_uri}: {e}")
 
@@ -1486,23 +1649,25 @@ class VikingFS:
         if not relation_uris:
             return []
 
-        results = []
-        abstracts = {}
-        overviews = {}
-        if include_l0:
-            abstracts = await self.read_batch(relation_uris, level="l0", ctx=ctx)
-        if include_l1:
-            overviews = await self.read_batch(relation_uris, level="l1", ctx=ctx)
-
-        for rel_uri in relation_uris:
-            info = {"uri": rel_uri}
-            if include_l0:
-                info["abstract"] = abstracts.get(rel_uri, "")
-            if include_l1:
-                info["overview"] = overviews.get(rel_uri, "")
-            results.append(info)
+        semaphore = asyncio.Semaphore(6)
 
-        return results
+        async def _read_or_empty(reader, rel_uri: str) -> str:
+            try:
+                return await reader(rel_uri, ctx=ctx)
+            except Exception:
+                return ""
+
+        async def _build_row(rel_uri: str) -> Dict[str, Any]:
+            # Rows are built directly, keeping relation order via gather
+            async with semaphore:
+                info = {"uri": rel_uri}
+                if include_l0:
+                    info["abstract"] = await _read_or_empty(self.abstract, rel_uri)
+                if include_l1:
+                    info["overview"] = await _read_or_empty(self.overview, rel_uri)
+                return info
+
+        return list(await asyncio.gather(*[_build_row(u) for u in relation_uris]))
 
     async def write_context(
         self,
@@ -1526,19 +1691,18 @@ class VikingFS:
                 if "exist" not in str(e).lower():
                     raise
 
-            if content:
-                content_path = f"{path}/{content_filename}"
-                if isinstance(content, str):
-                    content = content.encode("utf-8")
-                self.agfs.write(content_path, content)
-
-            if abstract:
-                abstract_path = f"{path}/.abstract.md"
-                self.agfs.write(abstract_path, abstract.encode("utf-8"))
-
-            if overview:
-                overview_path = f"{path}/.overview.md"
-                self.agfs.write(overview_path, overview.encode("utf-8"))
+            # All files share `path` as parent, which exists now, so the writes
+            # need no further dir creation and can be issued together.
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            writes = [
+                (f"{path}/{content_filename}", content),
+                (f"{path}/.abstract.md", (abstract or "").encode("utf-8")),
+                (f"{path}/.overview.md", (overview or "").encode("utf-8")),
+            ]
+            await asyncio.gather(
+                *[asyncio.to_thread(self.agfs.write, p, data) for p, data in writes if data]
+            )
 
         except Exception as e:
             logger.error(f"[VikingFS] Failed to write {uri}: {e}")
@@ -4,7 +4,10 @@
 
 from __future__ import annotations
 
+import threading
+import time
 import uuid
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from openviking.server.identity import RequestContext, Role
@@ -18,11 +21,74 @@ from openviking_cli.utils.config.vectordb_config import VectorDBBackendConfig
 logger = get_logger(__name__)
 
 
+# Interned filter nodes for the fields every tenant-scoped request filters on.
+# FilterExpr nodes are frozen, so callers may share them but must not mutate
+# the lists held by interned In nodes.
+_eq = lru_cache(maxsize=4096)(Eq)
+
+
+@lru_cache(maxsize=4096)
+def _in(field: str, values: tuple) -> In:
+    return In(field, list(values))
+
+
+@lru_cache(maxsize=1024)
+def _build_tenant_filter_cached(
+    account_id: str, user_space: str, agent_space: str, context_type: Optional[str]
+) -> FilterExpr:
+    """Build (and memoize) the tenant filter for a non-root request.
+
+    The returned expression is shared between callers and must not be mutated.
+    """
+    user_spaces = [user_space, agent_space]
+    resource_spaces = [*user_spaces, ""]
+    account_filter = _eq("account_id", account_id)
+
+    if context_type == "resource":
+        return And([account_filter, In("owner_space", resource_spaces)])
+    if context_type in {"memory", "skill"}:
+        return And([account_filter, In("owner_space", user_spaces)])
+
+    # context_type=None: include shared owner_space only for resources.
+    return And(
+        [
+            account_filter,
+            Or(
+                [
+                    And([_eq("context_type", "resource"), In("owner_space", resource_spaces)]),
+                    And(
+                        [
+                            _in("context_type", ("memory", "skill")),
+                            In("owner_space", user_spaces),
+                        ]
+                    ),
+                ]
+            ),
+        ]
+    )
+
+
 class VikingVectorIndexBackend:
     """Single-collection vector backend with adapter-based backend specialization."""
 
     DEFAULT_INDEX_NAME = "default"
     ALLOWED_CONTEXT_TYPES = {"resource", "skill", "memory"}
+    META_DATA_TTL_SECONDS = 60.0
+
+    __slots__ = (
+        "vector_dim",
+        "distance_metric",
+        "sparse_weight",
+        "_collection_name",
+        "_adapter",
+        "_mode",
+        "_collection_config",
+        "_meta_cache",
+        "_allowed_fields",
+        "_meta_ttl",
+        "_active_count_lock",
+        "__weakref__",
+    )
 
     def __init__(self, config: Optional[VectorDBBackendConfig]):
         if config is None:
@@ -45,7 +111,12 @@ class VikingVectorIndexBackend:
         )
 
         self._collection_config: Dict[str, Any] = {}
-        self._meta_data_cache: Dict[str, Any] = {}
+        # (monotonic expiry, collection meta) plus the schema field names derived from it
+        self._meta_cache: Optional[tuple[float, Dict[str, Any]]] = None
+        self._allowed_fields: Optional[frozenset[str]] = None
+        self._meta_ttl = self.META_DATA_TTL_SECONDS
+        # Sessions commit through run_async, possibly from several threads at once
+        self._active_count_lock = threading.Lock()
 
     @property
     def collection_name(self) -> str:
@@ -55,21 +126,37 @@ class VikingVectorIndexBackend:
         return self._adapter.get_collection()
 
     def _get_meta_data(self, coll: Collection) -> Dict[str, Any]:
-        if not self._meta_data_cache:
-            self._meta_data_cache = coll.get_meta_data() or {}
-        return self._meta_data_cache
+        cached = self._meta_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        self._refresh_meta_data(coll)
+        return self._meta_cache[1]
 
     def _refresh_meta_data(self, coll: Collection) -> None:
-        self._meta_data_cache = coll.get_meta_data() or {}
+        meta = coll.get_meta_data() or {}
+        self._meta_cache = (time.monotonic() + self._meta_ttl, meta)
+        self._allowed_fields = frozenset(item.get("FieldName") for item in meta.get("Fields", []))
 
-    def _filter_known_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _clear_meta_data(self) -> None:
+        self._meta_cache = None
+        self._allowed_fields = None
+
+    def _prime_meta(self) -> Optional[frozenset[str]]:
+        """Fetch collection meta and return the allowed field names, or None if unknown."""
         try:
-            coll = self._get_collection()
-            fields = self._get_meta_data(coll).get("Fields", [])
-            allowed = {item.get("FieldName") for item in fields}
-            return {k: v for k, v in data.items() if k in allowed and v is not None}
+            self._refresh_meta_data(self._get_collection())
         except Exception:
-            return data
+            return None
+        return self._allowed_fields
+
+    def _filter_known_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        allowed = self._allowed_fields
+        cached = self._meta_cache
+        if allowed is None or cached is None or time.monotonic() >= cached[0]:
+            allowed = self._prime_meta()
+            if allowed is None:
+                return dict(data)
+        return {k: v for k, v in data.items() if k in allowed and v is not None}
 
     # =========================================================================
     # Collection Management (single collection)
@@ -114,7 +201,7 @@ class VikingVectorIndexBackend:
             dropped = self._adapter.drop_collection()
             if dropped:
                 self._collection_config = {}
-                self._meta_data_cache = {}
+                self._clear_meta_data()
             return dropped
         except Exception as e:
             logger.error("Error dropping collection %s: %s", self._collection_name, e)
@@ -141,24 +228,43 @@ class VikingVectorIndexBackend:
     # Data Operations
     # =========================================================================
 
-    async def upsert(self, data: Dict[str, Any]) -> str:
-        payload = dict(data)
-        context_type = payload.get("context_type")
+    def _prepare_payload(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Validate context_type and build the write payload in a single dict.
+
+        Returns None for records with an invalid context_type.
+        """
+        context_type = data.get("context_type")
         if context_type and context_type not in self.ALLOWED_CONTEXT_TYPES:
             logger.warning(
                 "Invalid context_type: %s. Must be one of %s",
                 context_type,
                 sorted(self.ALLOWED_CONTEXT_TYPES),
             )
-            return ""
+            return None
 
+        # _filter_known_fields always returns a new dict, so the caller's data is untouched
+        payload = self._filter_known_fields(data)
         if not payload.get("id"):
-            payload["id"] = str(uuid.uuid4())
+            payload["id"] = uuid.uuid4().hex
+        return payload
 
-        payload = self._filter_known_fields(payload)
+    async def upsert(self, data: Dict[str, Any]) -> str:
+        payload = self._prepare_payload(data)
+        if payload is None:
+            return ""
         ids = self._adapter.upsert(payload)
         return ids[0] if ids else ""
 
+    async def upsert_many(self, records: List[Dict[str, Any]]) -> List[str]:
+        """Upsert several records in one adapter call.
+
+        Records with an invalid context_type are skipped, mirroring ``upsert``.
+        """
+        payloads = [p for p in map(self._prepare_payload, records) if p is not None]
+        if not payloads:
+            return []
+        return self._adapter.upsert(payloads)
+
     async def get(self, ids: List[str]) -> List[Dict[str, Any]]:
         try:
             return self._adapter.get(ids)
@@ -175,7 +281,7 @@ class VikingVectorIndexBackend:
 
     async def exists(self, id: str) -> bool:
         try:
-            return len(await self.get([id])) > 0
+            return self._adapter.exists(id)
         except Exception:
             return False
 
@@ -256,43 +362,17 @@ class VikingVectorIndexBackend:
         )
 
     async def remove_by_uri(self, uri: str) -> int:
-        try:
-            target_records = await self.filter(
-                {"op": "must", "field": "uri", "conds": [uri]},
-                limit=10,
-            )
-            if not target_records:
-                return 0
+        """Delete the record at uri and, for directories, everything beneath it.
 
-            total_deleted = 0
-            if any(r.get("level") in [0, 1] for r in target_records):
-                total_deleted += await self._remove_descendants(parent_uri=uri)
-
-            ids = [r.get("id") for r in target_records if r.get("id")]
-            if ids:
-                total_deleted += await self.delete(ids)
-            return total_deleted
+        The uri path index matches a node together with its whole subtree, so a
+        single filtered delete replaces the lookup-then-walk over parent_uri.
+        """
+        try:
+            return self._adapter.delete(filter=PathScope("uri", uri, depth=-1))
         except Exception as e:
             logger.error("Error removing URI %s: %s", uri, e)
             return 0
 
-    async def _remove_descendants(self, parent_uri: str) -> int:
-        total_deleted = 0
-        children = await self.filter(
-            {"op": "must", "field": "parent_uri", "conds": [parent_uri]},
-            limit=100000,
-        )
-        for child in children:
-            child_uri = child.get("uri")
-            level = child.get("level", 2)
-            if level in [0, 1] and child_uri:
-                total_deleted += await self._remove_descendants(parent_uri=child_uri)
-            child_id = child.get("id")
-            if child_id:
-                await self.delete([child_id])
-                total_deleted += 1
-        return total_deleted
-
     # =========================================================================
     # Semantic Context Operations (Tenant-Aware)
     # =========================================================================
@@ -314,6 +394,10 @@ class VikingVectorIndexBackend:
             target_directories=target_directories,
             extra_filter=extra_filter,
         )
+        if scope_filter is None:
+            if query_vector is None and sparse_query_vector is None:
+                return []
+            scope_filter = RawDSL({"op": "and", "conds": []})
         return await self.search(
             query_vector=query_vector,
             sparse_query_vector=sparse_query_vector,
@@ -335,14 +419,12 @@ class VikingVectorIndexBackend:
         if not query_vector:
             return []
 
-        merged_filter = self._merge_filters(
-            self._build_scope_filter(
-                ctx=ctx,
-                context_type=context_type,
-                target_directories=target_directories,
-                extra_filter=extra_filter,
-            ),
-            In("level", [0, 1]),
+        merged_filter = self._build_scope_filter_with(
+            _in("level", (0, 1)),
+            ctx=ctx,
+            context_type=context_type,
+            target_directories=target_directories,
+            extra_filter=extra_filter,
         )
         return await self.search(
             query_vector=query_vector,
@@ -362,14 +444,12 @@ class VikingVectorIndexBackend:
         extra_filter: Optional[FilterExpr | Dict[str, Any]] = None,
         limit: int = 10,
     ) -> List[Dict[str, Any]]:
-        merged_filter = self._merge_filters(
+        merged_filter = self._build_scope_filter_with(
             PathScope("uri", parent_uri, depth=1),
-            self._build_scope_filter(
-                ctx=ctx,
-                context_type=context_type,
-                target_directories=target_directories,
-                extra_filter=extra_filter,
-            ),
+            ctx=ctx,
+            context_type=context_type,
+            target_directories=target_directories,
+            extra_filter=extra_filter,
         )
         return await self.search(
             query_vector=query_vector,
@@ -387,9 +467,9 @@ class VikingVectorIndexBackend:
         limit: int = 5,
     ) -> List[Dict[str, Any]]:
         conds: List[FilterExpr] = [
-            Eq("context_type", "memory"),
-            Eq("level", 2),
-            Eq("account_id", account_id),
+            _eq("context_type", "memory"),
+            _eq("level", 2),
+            _eq("account_id", account_id),
         ]
         if owner_space:
             conds.append(Eq("owner_space", owner_space))
@@ -410,30 +490,61 @@ class VikingVectorIndexBackend:
         level: Optional[int] = None,
         limit: int = 1,
     ) -> List[Dict[str, Any]]:
-        conds: List[FilterExpr] = [PathScope("uri", uri, depth=0), Eq("account_id", account_id)]
+        conds: List[FilterExpr] = [PathScope("uri", uri, depth=0), _eq("account_id", account_id)]
         if owner_space:
             conds.append(Eq("owner_space", owner_space))
         if level is not None:
             conds.append(Eq("level", level))
         return await self.filter(filter=And(conds), limit=limit)
 
+    async def get_contexts_by_uris(
+        self, account_id: str, uris: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the first record for each uri, keyed by uri; missing uris are omitted."""
+        if not uris:
+            return {}
+        return self._records_by_uri(account_id, list(dict.fromkeys(uris)))
+
+    def _records_by_uri(self, account_id: str, uris: List[str]) -> Dict[str, Dict[str, Any]]:
+        # One Or filter per _URI_BATCH_SIZE uris instead of a lookup per uri
+        account_filter = _eq("account_id", account_id)
+        by_uri: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(uris), self._URI_BATCH_SIZE):
+            batch = uris[start : start + self._URI_BATCH_SIZE]
+            records = self._adapter.query(
+                filter=And([account_filter, Or([PathScope("uri", uri, depth=0) for uri in batch])]),
+                # A URI can have one record per semantic layer (L0/L1/L2)
+                limit=len(batch) * 3,
+            )
+            for record in records:
+                uri = record.get("uri")
+                # Keep the first record per URI, matching a per-URI limit=1 lookup
+                if uri and uri not in by_uri:
+                    by_uri[uri] = record
+        return by_uri
+
     async def delete_account_data(self, account_id: str) -> int:
-        return self._adapter.delete(filter=Eq("account_id", account_id))
+        return self._adapter.delete(filter=_eq("account_id", account_id))
+
+    # Max URIs folded into one Or filter, keeping request DSL size bounded
+    _URI_BATCH_SIZE = 256
 
     async def delete_uris(self, ctx: RequestContext, uris: List[str]) -> None:
-        for uri in uris:
-            conds: List[FilterExpr] = [
-                Eq("account_id", ctx.account_id),
-                Or([Eq("uri", uri), In("uri", [f"{uri}/"])]),
-            ]
-            if ctx.role == Role.USER and uri.startswith(("viking://user/", "viking://agent/")):
-                owner_space = (
-                    ctx.user.user_space_name()
-                    if uri.startswith("viking://user/")
-                    else ctx.user.agent_space_name()
-                )
-                conds.append(Eq("owner_space", owner_space))
-            self._adapter.delete(filter=And(conds))
+        """Delete records for uris (and their descendants), one tenant-scoped filter per batch."""
+        account_filter = _eq("account_id", ctx.account_id)
+        for start in range(0, len(uris), self._URI_BATCH_SIZE):
+            uri_conds: List[FilterExpr] = []
+            for uri in uris[start : start + self._URI_BATCH_SIZE]:
+                uri_cond: FilterExpr = Or([Eq("uri", uri), In("uri", [f"{uri}/"])])
+                if ctx.role == Role.USER and uri.startswith(("viking://user/", "viking://agent/")):
+                    owner_space = (
+                        ctx.user.user_space_name()
+                        if uri.startswith("viking://user/")
+                        else ctx.user.agent_space_name()
+                    )
+                    uri_cond = And([uri_cond, Eq("owner_space", owner_space)])
+                uri_conds.append(uri_cond)
+            self._adapter.delete(filter=And([account_filter, Or(uri_conds)]))
 
     async def update_uri_mapping(
         self,
@@ -443,7 +554,7 @@ class VikingVectorIndexBackend:
         new_parent_uri: str,
     ) -> bool:
         records = await self.filter(
-            filter=And([Eq("uri", uri), Eq("account_id", ctx.account_id)]),
+            filter=And([Eq("uri", uri), _eq("account_id", ctx.account_id)]),
             limit=1,
         )
         if not records or "id" not in records[0]:
@@ -452,17 +563,28 @@ class VikingVectorIndexBackend:
         return bool(await self.upsert(updated))
 
     async def increment_active_count(self, ctx: RequestContext, uris: List[str]) -> int:
-        updated = 0
-        for uri in uris:
-            records = await self.get_context_by_uri(account_id=ctx.account_id, uri=uri, limit=1)
-            if not records:
-                continue
-            record = records[0]
-            current = int(record.get("active_count", 0) or 0)
-            record["active_count"] = current + 1
-            if await self.upsert(record):
-                updated += 1
-        return updated
+        """Bump active_count by one for each distinct uri; returns records updated."""
+        if not uris:
+            return 0
+        return self._increment_active_count_sync(ctx.account_id, list(dict.fromkeys(uris)))
+
+    def _increment_active_count_sync(self, account_id: str, uris: List[str]) -> int:
+        # None of the adapters expose a server-side increment, so the read and the
+        # write-back run under one lock to keep concurrent commits from losing updates.
+        with self._active_count_lock:
+            by_uri = self._records_by_uri(account_id, uris)
+            payloads = []
+            for uri in uris:
+                record = by_uri.get(uri)
+                if record is None:
+                    continue
+                count = int(record.get("active_count", 0) or 0) + 1
+                payload = self._prepare_payload({**record, "active_count": count})
+                if payload is not None:
+                    payloads.append(payload)
+            if not payloads:
+                return 0
+            return len(self._adapter.upsert(payloads))
 
     def _build_scope_filter(
         self,
@@ -471,9 +593,28 @@ class VikingVectorIndexBackend:
         target_directories: Optional[List[str]],
         extra_filter: Optional[FilterExpr | Dict[str, Any]],
     ) -> Optional[FilterExpr]:
-        filters: List[FilterExpr] = []
+        return self._build_scope_filter_with(
+            ctx=ctx,
+            context_type=context_type,
+            target_directories=target_directories,
+            extra_filter=extra_filter,
+        )
+
+    def _build_scope_filter_with(
+        self,
+        *extra: FilterExpr,
+        ctx: RequestContext,
+        context_type: Optional[str],
+        target_directories: Optional[List[str]],
+        extra_filter: Optional[FilterExpr | Dict[str, Any]],
+    ) -> Optional[FilterExpr]:
+        """Build the tenant scope filter with extra conditions merged in one pass.
+
+        Returns None when no condition applies.
+        """
+        filters: List[FilterExpr] = list(extra)
         if context_type:
-            filters.append(Eq("context_type", context_type))
+            filters.append(_eq("context_type", context_type))
 
         tenant_filter = self._tenant_filter(ctx, context_type=context_type)
         if tenant_filter:
@@ -494,10 +635,7 @@ class VikingVectorIndexBackend:
             else:
                 filters.append(extra_filter)
 
-        merged = self._merge_filters(*filters)
-        if merged is None:
-            return RawDSL({"op": "and", "conds": []})
-        return merged
+        return self._merge_filters(*filters)
 
     @staticmethod
     def _tenant_filter(
@@ -505,32 +643,9 @@ class VikingVectorIndexBackend:
     ) -> Optional[FilterExpr]:
         if ctx.role == Role.ROOT:
             return None
-
-        user_spaces = [ctx.user.user_space_name(), ctx.user.agent_space_name()]
-        resource_spaces = [*user_spaces, ""]
-        account_filter = Eq("account_id", ctx.account_id)
-
-        if context_type == "resource":
-            return And([account_filter, In("owner_space", resource_spaces)])
-        if context_type in {"memory", "skill"}:
-            return And([account_filter, In("owner_space", user_spaces)])
-
-        # context_type=None: include shared owner_space only for resources.
-        return And(
-            [
-                account_filter,
-                Or(
-                    [
-                        And([Eq("context_type", "resource"), In("owner_space", resource_spaces)]),
-                        And(
-                            [
-                                In("context_type", ["memory", "skill"]),
-                                In("owner_space", user_spaces),
-                            ]
-                        ),
-                    ]
-                ),
-            ]
+        user = ctx.user
+        return _build_tenant_filter_cached(
+            ctx.account_id, user.user_space_name(), user.agent_space_name(), context_type
         )
 
     @staticmethod
@@ -558,6 +673,14 @@ class VikingVectorIndexBackend:
         cursor: Optional[str] = None,
         output_fields: Optional[List[str]] = None,
     ) -> tuple[List[Dict[str, Any]], Optional[str]]:
+        """Page through records matching filter.
+
+        The cursor is an opaque token; callers must only pass back the value
+        returned by the previous call. It currently encodes an offset: keyset
+        paging on ``id`` is not possible because the primary key is not part of
+        the collection's scalar index, so it can be neither range-filtered nor
+        used as a sort key.
+        """
         offset = int(cursor) if cursor else 0
         records = await self.filter(
             filter=filter or {},
@@ -590,7 +713,7 @@ class VikingVectorIndexBackend:
         try:
             self._adapter.close()
             self._collection_config = {}
-            self._meta_data_cache = {}
+            self._clear_meta_data()
             logger.info("VikingDB backend closed")
         except Exception as e:
             logger.error("Error closing VikingDB backend: %s", e)
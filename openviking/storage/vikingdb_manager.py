@@ -30,6 +30,8 @@ class VikingDBManager(VikingVectorIndexBackend):
         manager = VikingDBManager(vectordb_config=..., queue_manager=qm)
     """
 
+    __slots__ = ("_queue_manager", "_closing")
+
     def __init__(
         self,
         vectordb_config: VectorDBBackendConfig,
@@ -7,11 +7,64 @@ This module provides shared functionality for parsing URLs from code hosting
 platforms like GitHub and GitLab.
 """
 
-from typing import Optional
+import re
+from typing import Any, NamedTuple, Optional
 from urllib.parse import urlparse
 
 from openviking_cli.utils.config import get_openviking_config
 
+# URL schemes that urlparse can yield a code hosting netloc for
+_URL_SCHEME_PREFIXES = ("http://", "https://", "git://", "ssh://")
+
+# Maps every ASCII char that is not alphanumeric, "-" or "_" to "_"
+_SANITIZE_TABLE = str.maketrans(
+    {chr(c): "_" for c in range(128) if not (chr(c).isalnum() or chr(c) in "-_")}
+)
+
+# Unicode-aware equivalent for non-ASCII segments (\w keeps Unicode letters/digits)
+_SANITIZE_RE = re.compile(r"[^\w-]")
+
+
+def _sanitize_segment(segment: str) -> str:
+    """Replace characters other than alphanumerics, "-" and "_" with "_"."""
+    if segment.isascii():
+        return segment.translate(_SANITIZE_TABLE)
+    return _SANITIZE_RE.sub("_", segment)
+
+
+class _DomainSets(NamedTuple):
+    github: frozenset
+    gitlab: frozenset
+    # github + gitlab: domains with a known org/repo path layout
+    github_or_gitlab: frozenset
+    # github + gitlab + generic code hosting domains
+    all: frozenset
+
+
+_domain_sets_cache: Optional[tuple[Any, _DomainSets]] = None
+
+
+def _domain_sets() -> _DomainSets:
+    """Return domain sets for the current code config.
+
+    Rebuilt only when the config object changes (e.g. after a config reload).
+    """
+    global _domain_sets_cache
+    code_config = get_openviking_config().code
+    cached = _domain_sets_cache
+    if cached is not None and cached[0] is code_config:
+        return cached[1]
+    github = frozenset(code_config.github_domains)
+    gitlab = frozenset(code_config.gitlab_domains)
+    sets = _DomainSets(
+        github=github,
+        gitlab=gitlab,
+        github_or_gitlab=github | gitlab,
+        all=github | gitlab | frozenset(code_config.code_hosting_domains),
+    )
+    _domain_sets_cache = (code_config, sets)
+    return sets
+
 
 def parse_code_hosting_url(url: str) -> Optional[str]:
     """Parse code hosting platform URL to get org/repo path.
@@ -24,21 +77,14 @@ def parse_code_hosting_url(url: str) -> Optional[str]:
         org/repo path like "volcengine/OpenViking" or None if not a valid
         code hosting URL
     """
-    config = get_openviking_config()
-    all_domains = list(
-        set(
-            config.code.github_domains
-            + config.code.gitlab_domains
-            + config.code.code_hosting_domains
-        )
-    )
+    domains = _domain_sets()
 
     # Handle git@ SSH URLs: git@host:org/repo.git
     if url.startswith("git@"):
         if ":" not in url[4:]:
             return None
         host_part, path_part = url[4:].split(":", 1)
-        if host_part not in all_domains:
+        if host_part not in domains.all:
             return None
         path_parts = [p for p in path_part.split("/") if p]
         if len(path_parts) < 2:
@@ -48,30 +94,22 @@ def parse_code_hosting_url(url: str) -> Optional[str]:
         repo = path_parts[1]
         if repo.endswith(".git"):
             repo = repo[:-4]
-        org = "".join(c if c.isalnum() or c in "-_" else "_" for c in org)
-        repo = "".join(c if c.isalnum() or c in "-_" else "_" for c in repo)
-        return f"{org}/{repo}"
+        return f"{_sanitize_segment(org)}/{_sanitize_segment(repo)}"
 
-    if not url.startswith(("http://", "https://", "git://", "ssh://")):
+    if not url.startswith(_URL_SCHEME_PREFIXES):
         return None
 
     parsed = urlparse(url)
     path_parts = [p for p in parsed.path.split("/") if p]
 
     # For GitHub/GitLab URLs with org/repo structure
-    if (
-        parsed.netloc in config.code.github_domains + config.code.gitlab_domains
-        and len(path_parts) >= 2
-    ):
+    if parsed.netloc in domains.github_or_gitlab and len(path_parts) >= 2:
         # Take first two parts: org/repo
         org = path_parts[0]
         repo = path_parts[1]
         if repo.endswith(".git"):
             repo = repo[:-4]
-        # Sanitize both parts
-        org = "".join(c if c.isalnum() or c in "-_" else "_" for c in org)
-        repo = "".join(c if c.isalnum() or c in "-_" else "_" for c in repo)
-        return f"{org}/{repo}"
+        return f"{_sanitize_segment(org)}/{_sanitize_segment(repo)}"
 
     return None
 
@@ -85,8 +123,9 @@ def is_github_url(url: str) -> bool:
     Returns:
         True if the URL is a GitHub URL
     """
-    config = get_openviking_config()
-    return urlparse(url).netloc in config.code.github_domains
+    if not url.startswith(_URL_SCHEME_PREFIXES):
+        return False
+    return urlparse(url).netloc in _domain_sets().github
 
 
 def is_gitlab_url(url: str) -> bool:
@@ -98,8 +137,9 @@ def is_gitlab_url(url: str) -> bool:
     Returns:
         True if the URL is a GitLab URL
     """
-    config = get_openviking_config()
-    return urlparse(url).netloc in config.code.gitlab_domains
+    if not url.startswith(_URL_SCHEME_PREFIXES):
+        return False
+    return urlparse(url).netloc in _domain_sets().gitlab
 
 
 def is_code_hosting_url(url: str) -> bool:
@@ -111,14 +151,7 @@ def is_code_hosting_url(url: str) -> bool:
     Returns:
         True if the URL is a code hosting platform URL
     """
-    config = get_openviking_config()
-    all_domains = list(
-        set(
-            config.code.github_domains
-            + config.code.gitlab_domains
-            + config.code.code_hosting_domains
-        )
-    )
+    all_domains = _domain_sets().all
 
     # Handle git@ SSH URLs
     if url.startswith("git@"):
@@ -127,6 +160,8 @@ def is_code_hosting_url(url: str) -> bool:
         host_part = url[4:].split(":", 1)[0]
         return host_part in all_domains
 
+    if not url.startswith(_URL_SCHEME_PREFIXES):
+        return False
     return urlparse(url).netloc in all_domains
 
 
@@ -164,16 +199,8 @@ def is_git_repo_url(url: str) -> bool:
 
     # http/https: check domain AND require exactly 2 path parts (owner/repo)
     if url.startswith(("http://", "https://")):
-        config = get_openviking_config()
-        all_domains = list(
-            set(
-                config.code.github_domains
-                + config.code.gitlab_domains
-                + config.code.code_hosting_domains
-            )
-        )
         parsed = urlparse(url)
-        if parsed.netloc not in all_domains:
+        if parsed.netloc not in _domain_sets().all:
             return False
         path_parts = [p for p in parsed.path.split("/") if p]
         # Strip .git suffix from last part for counting
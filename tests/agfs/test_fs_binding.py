@@ -7,6 +7,8 @@ Tests the python binding mode of VikingFS which directly uses AGFS implementatio
 without HTTP server.
 """
 
+import asyncio
+import itertools
 import os
 import shutil
 import uuid
@@ -19,86 +21,107 @@ from openviking_cli.utils.config.agfs_config import AGFSConfig
 # Direct configuration for testing
 AGFS_CONF = AGFSConfig(path="/tmp/ov-test", backend="local", mode="binding-client")
 
+# Unique, ordered suffixes for test paths: one random session prefix plus a counter
+_PREFIX = uuid.uuid4().hex[:8]
+_COUNTER = itertools.count()
+
+
+def _unique() -> str:
+    return f"{_PREFIX}{next(_COUNTER):08x}"
+
+
 # clean up test directory if it exists
 if os.path.exists(AGFS_CONF.path):
     shutil.rmtree(AGFS_CONF.path)
 
 
-@pytest.fixture(scope="module")
-async def viking_fs_binding_instance():
-    """Initialize VikingFS with binding mode."""
+# Binding clients keyed by AGFS data path, reused for the whole session
+_AGFS_CLIENTS = {}
+
+
+@pytest.fixture(scope="session")
+def agfs_binding_client():
+    """AGFS binding client created once per session for AGFS_CONF."""
     from openviking.utils.agfs_utils import create_agfs_client
 
-    # Create AGFS client
-    agfs_client = create_agfs_client(AGFS_CONF)
+    client = _AGFS_CLIENTS.get(AGFS_CONF.path)
+    if client is None:
+        client = _AGFS_CLIENTS[AGFS_CONF.path] = create_agfs_client(AGFS_CONF)
+    return client
 
-    # Initialize VikingFS with client
-    vfs = init_viking_fs(agfs=agfs_client)
-    # make sure default/temp directory exists
-    await vfs.mkdir("viking://temp/", exist_ok=True)
 
-    # Ensure test directory exists
+@pytest.fixture(scope="module")
+async def viking_fs_binding_instance(agfs_binding_client):
+    """Initialize VikingFS with binding mode."""
+    vfs = init_viking_fs(agfs=agfs_binding_client)
+    # make sure default/temp directory exists
     await vfs.mkdir("viking://temp/", exist_ok=True)
 
     yield vfs
 
 
+# (case_id, file suffix, payload) for the write -> stat/ls/read -> rm cycle
+FILE_CASES = [
+    ("text", ".txt", "Hello VikingFS Binding! " + _unique()),
+    ("binary", ".bin", bytes(range(256))),
+]
+
+
 @pytest.mark.asyncio
 class TestVikingFSBindingLocal:
     """Test VikingFS operations with binding mode (local backend)."""
 
-    async def test_file_operations(self, viking_fs_binding_instance):
+    @pytest.mark.parametrize("case_id, suffix, payload", FILE_CASES)
+    async def test_file_operations(self, viking_fs_binding_instance, case_id, suffix, payload):
         """Test VikingFS file operations: read, write, ls, stat."""
         vfs = viking_fs_binding_instance
 
-        test_filename = f"binding_file_{uuid.uuid4().hex}.txt"
-        test_content = "Hello VikingFS Binding! " + uuid.uuid4().hex
+        test_filename = f"binding_{case_id}_{_unique()}{suffix}"
         test_uri = f"viking://temp/{test_filename}"
 
-        await vfs.write(test_uri, test_content)
+        await vfs.write(test_uri, payload)
 
-        stat_info = await vfs.stat(test_uri)
+        stat_info, entries, read_data = await asyncio.gather(
+            vfs.stat(test_uri), vfs.ls("viking://temp/"), vfs.read(test_uri)
+        )
         assert stat_info["name"] == test_filename
         assert not stat_info["isDir"]
-
-        entries = await vfs.ls("viking://temp/")
-        assert any(e["name"] == test_filename for e in entries)
-
-        read_data = await vfs.read(test_uri)
-        assert read_data.decode("utf-8") == test_content
+        assert test_filename in {e["name"] for e in entries}
+        expected = payload.encode("utf-8") if isinstance(payload, str) else payload
+        assert read_data == expected
 
         await vfs.rm(test_uri)
 
     async def test_directory_operations(self, viking_fs_binding_instance):
         """Test VikingFS directory operations: mkdir, rm, ls, stat."""
         vfs = viking_fs_binding_instance
-        test_dir = f"binding_dir_{uuid.uuid4().hex}"
+        test_dir = f"binding_dir_{_unique()}"
         test_dir_uri = f"viking://temp/{test_dir}/"
 
         await vfs.mkdir(test_dir_uri)
 
-        stat_info = await vfs.stat(test_dir_uri)
+        file_uri = f"{test_dir_uri}inner.txt"
+        stat_info, root_entries, _ = await asyncio.gather(
+            vfs.stat(test_dir_uri),
+            vfs.ls("viking://temp/"),
+            vfs.write(file_uri, "inner content"),
+        )
         assert stat_info["name"] == test_dir
         assert stat_info["isDir"]
-
-        root_entries = await vfs.ls("viking://temp/")
-        assert any(e["name"] == test_dir and e["isDir"] for e in root_entries)
-
-        file_uri = f"{test_dir_uri}inner.txt"
-        await vfs.write(file_uri, "inner content")
+        assert test_dir in {e["name"] for e in root_entries if e["isDir"]}
 
         sub_entries = await vfs.ls(test_dir_uri)
-        assert any(e["name"] == "inner.txt" for e in sub_entries)
+        assert "inner.txt" in {e["name"] for e in sub_entries}
 
         await vfs.rm(test_dir_uri, recursive=True)
 
         root_entries = await vfs.ls("viking://temp/")
-        assert not any(e["name"] == test_dir for e in root_entries)
+        assert test_dir not in {e["name"] for e in root_entries}
 
     async def test_tree_operations(self, viking_fs_binding_instance):
         """Test VikingFS tree operations."""
         vfs = viking_fs_binding_instance
-        base_dir = f"binding_tree_test_{uuid.uuid4().hex}"
+        base_dir = f"binding_tree_test_{_unique()}"
         sub_dir = f"viking://temp/{base_dir}/a/b/"
         file_uri = f"{sub_dir}leaf.txt"
 
@@ -109,17 +132,3 @@ class TestVikingFSBindingLocal:
         assert any("leaf.txt" in e["uri"] for e in entries)
 
         await vfs.rm(f"viking://temp/{base_dir}/", recursive=True)
-
-    async def test_binary_operations(self, viking_fs_binding_instance):
-        """Test VikingFS binary file operations."""
-        vfs = viking_fs_binding_instance
-        test_filename = f"binding_binary_{uuid.uuid4().hex}.bin"
-        test_content = bytes([i % 256 for i in range(256)])
-        test_uri = f"viking://temp/{test_filename}"
-
-        await vfs.write(test_uri, test_content)
-
-        read_data = await vfs.read(test_uri)
-        assert read_data == test_content
-
-        await vfs.rm(test_uri)
@@ -5,6 +5,7 @@
 
 import asyncio
 import shutil
+import sys
 from pathlib import Path
 from typing import AsyncGenerator, Generator
 
@@ -26,6 +27,19 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed (not available on Windows)."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
 @pytest.fixture(scope="function")
 def temp_dir() -> Generator[Path, None, None]:
     """Create temp directory, auto-cleanup before and after test"""
@@ -140,6 +154,26 @@ This is batch file number {i} for testing batch operations.
     return files
 
 
+@pytest.fixture
+def arecorder():
+    """Factory for async callables that record their (args, kwargs) in ``.calls``.
+
+    A lighter stand-in for AsyncMock when a test only checks what was awaited.
+    """
+
+    def make(return_value=None):
+        calls = []
+
+        async def recorder(*args, **kwargs):
+            calls.append((args, kwargs))
+            return return_value
+
+        recorder.calls = calls
+        return recorder
+
+    return make
+
+
 # ============ Client Fixtures ============
 
 
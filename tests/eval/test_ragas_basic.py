@@ -46,17 +46,16 @@ def test_question_loader():
 
     try:
         questions = []
-        with open(temp_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    item = json.loads(line)
-                    if "question" in item:
-                        questions.append(item)
-                except json.JSONDecodeError:
-                    pass
+        for line in Path(temp_path).read_bytes().split(b"\n"):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+                if "question" in item:
+                    questions.append(item)
+            except json.JSONDecodeError:
+                pass
 
         assert len(questions) == 2
         assert questions[0]["question"] == "What is OpenViking?"
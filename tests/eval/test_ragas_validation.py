@@ -6,25 +6,57 @@ Validation script for eval module using local_doc_example_glm5.jsonl.
 """
 
 import json
+import mmap
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+def _iter_jsonl(file_path: str) -> Iterator[Any]:
+    """Yield parsed JSONL items, reporting and skipping lines that are not valid JSON.
+
+    The file is memory-mapped and scanned for newlines, so only one line at a
+    time is copied out instead of materializing the whole file.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            line_num = 0
+            while start < size:
+                end = mm.find(b"\n", start)
+                if end == -1:
+                    end = size
+                line_num += 1
+                line = mm[start:end].strip()
+                start = end + 1
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"❌ Line {line_num}: Invalid JSON - {e}")
 
 
 def load_jsonl(file_path: str) -> List[Dict[str, Any]]:
     """Load JSONL file and return list of dicts."""
-    data = []
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                item = json.loads(line)
-                data.append(item)
-            except json.JSONDecodeError as e:
-                print(f"❌ Line {line_num}: Invalid JSON - {e}")
-    return data
+    return list(_iter_jsonl(file_path))
+
+
+def parse_and_validate(file_path: str) -> Iterator[Tuple[Any, List[str]]]:
+    """Parse and validate JSONL items in a single pass.
+
+    Structural checks only run on lines that parsed as JSON objects.
+    """
+    for index, item in enumerate(_iter_jsonl(file_path)):
+        if not isinstance(item, dict):
+            yield item, [f"Item {index}: should be a JSON object"]
+        else:
+            yield item, validate_item(item, index)
 
 
 def validate_item(item: Dict[str, Any], index: int) -> List[str]:
@@ -38,7 +70,8 @@ def validate_item(item: Dict[str, Any], index: int) -> List[str]:
         errors.append(f"Item {index}: Missing 'files' field")
     elif not isinstance(item["files"], list):
         errors.append(f"Item {index}: 'files' should be a list")
-    else:
+    elif not all(type(ref) is str and ":" in ref for ref in item["files"]):
+        # Only walk refs individually when at least one is malformed
         for i, file_ref in enumerate(item["files"]):
             if not isinstance(file_ref, str):
                 errors.append(f"Item {index}: files[{i}] should be a string")
@@ -122,12 +155,12 @@ def test_question_loader():
 
     jsonl_path = Path.cwd() / "openviking" / "eval" / "datasets" / "local_doc_example_glm5.jsonl"
 
-    data = load_jsonl(jsonl_path)
-    print(f"  ✅ Loaded {len(data)} questions from JSONL")
-
+    data = []
     errors = []
-    for i, item in enumerate(data):
-        errors.extend(validate_item(item, i))
+    for item, item_errors in parse_and_validate(jsonl_path):
+        data.append(item)
+        errors.extend(item_errors)
+    print(f"  ✅ Loaded {len(data)} questions from JSONL")
 
     if errors:
         print(f"  ❌ Found {len(errors)} validation errors:")
@@ -152,12 +185,12 @@ def main():
 
     print(f"\n📂 Loading: {jsonl_path}")
 
-    data = load_jsonl(jsonl_path)
-    print(f"✅ Loaded {len(data)} items")
-
+    data = []
     all_errors = []
-    for i, item in enumerate(data):
-        all_errors.extend(validate_item(item, i))
+    for item, item_errors in parse_and_validate(jsonl_path):
+        data.append(item)
+        all_errors.extend(item_errors)
+    print(f"✅ Loaded {len(data)} items")
 
     if all_errors:
         print(f"\n❌ Found {len(all_errors)} validation errors")
@@ -168,29 +201,20 @@ def main():
     else:
         print(f"\n✅ All {len(data)} items validated successfully")
 
-    try:
-        test_eval_types(data)
-    except Exception as e:
-        print(f"  ❌ Eval types test failed: {e}")
-        all_errors.append(f"Eval types test: {e}")
-
-    try:
-        test_pipeline_initialization()
-    except Exception as e:
-        print(f"  ❌ Pipeline test failed: {e}")
-        all_errors.append(f"Pipeline test: {e}")
-
-    try:
-        test_question_loader()
-    except Exception as e:
-        print(f"  ❌ Question loader test failed: {e}")
-        all_errors.append(f"Question loader test: {e}")
-
-    try:
-        test_evaluator_initialization()
-    except Exception as e:
-        print(f"  ❌ Evaluator test failed: {e}")
-        all_errors.append(f"Evaluator test: {e}")
+    # The checks share no state; running them together overlaps their heavy imports.
+    checks = [
+        ("Eval types", test_eval_types),
+        ("Pipeline", test_pipeline_initialization),
+        ("Question loader", test_question_loader),
+        ("Evaluator", test_evaluator_initialization),
+    ]
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [(name, executor.submit(check)) for name, check in checks]
+    for name, future in futures:
+        error = future.exception()
+        if error is not None:
+            print(f"  ❌ {name} test failed: {error}")
+            all_errors.append(f"{name} test: {error}")
 
     print("\n" + "=" * 60)
     if all_errors:
@@ -71,11 +71,18 @@ class DummyStorage:
         return []
 
 
-@pytest.mark.asyncio
-async def test_retrieve_honors_target_directories_scope_filter():
-    target_uri = "viking://resources/foo"
+@pytest.fixture
+def storage_and_retriever():
+    """DummyStorage plus a retriever bound to it, with empty call logs."""
     storage = DummyStorage()
     retriever = HierarchicalRetriever(storage=storage, embedder=None, rerank_config=None)
+    return storage, retriever
+
+
+@pytest.mark.asyncio
+async def test_retrieve_honors_target_directories_scope_filter(storage_and_retriever):
+    target_uri = "viking://resources/foo"
+    storage, retriever = storage_and_retriever
     ctx = RequestContext(user=UserIdentifier("acc1", "user1", "agent1"), role=Role.USER)
 
     query = TypedQuery(
@@ -3,6 +3,7 @@
 
 """Tests for APIKeyManager (openviking/server/api_keys.py)."""
 
+import copy
 import uuid
 
 import pytest
@@ -22,23 +23,44 @@ def _uid() -> str:
 
 ROOT_KEY = "test-root-key-abcdef1234567890abcdef1234567890"
 
+# manager_service lives on the module event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest_asyncio.fixture(scope="function")
-async def manager_service(temp_dir):
-    """OpenVikingService for APIKeyManager tests."""
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def manager_service(tmp_path_factory):
+    """OpenVikingService shared by all APIKeyManager tests in this module.
+
+    Tests isolate themselves through unique ``_uid()`` account names, so one
+    service bring-up is enough for the whole module.
+    """
     svc = OpenVikingService(
-        path=str(temp_dir / "mgr_data"), user=UserIdentifier.the_default_user("mgr_user")
+        path=str(tmp_path_factory.mktemp("mgr_data")),
+        user=UserIdentifier.the_default_user("mgr_user"),
     )
     await svc.initialize()
     yield svc
     await svc.close()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def manager(manager_service):
-    """Fresh APIKeyManager instance, loaded."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _loaded_snapshot(manager_service):
+    """In-memory state of an APIKeyManager loaded once from the initial AGFS data."""
     mgr = APIKeyManager(root_key=ROOT_KEY, agfs_url=manager_service._agfs_url)
     await mgr.load()
+    return mgr._accounts, mgr._user_keys
+
+
+@pytest.fixture
+def manager(manager_service, _loaded_snapshot):
+    """Fresh APIKeyManager instance, restored from the loaded snapshot.
+
+    Tests needing a real load from AGFS (see persistence tests) build their own.
+    """
+    accounts, user_keys = _loaded_snapshot
+    mgr = APIKeyManager(root_key=ROOT_KEY, agfs_url=manager_service._agfs_url)
+    mgr._accounts = copy.deepcopy(accounts)
+    mgr._user_keys = copy.deepcopy(user_keys)
     return mgr
 
 
@@ -3,9 +3,13 @@
 
 """Tests for session endpoints."""
 
+import asyncio
+import threading
+
 import httpx
 
 from openviking.server.identity import RequestContext, Role
+from openviking.session import Session
 from openviking_cli.session.user_id import UserIdentifier
 
 
@@ -145,6 +149,53 @@ async def test_compress_session(client: httpx.AsyncClient):
     assert resp.json()["status"] == "ok"
 
 
+async def test_commit_session_without_wait(client: httpx.AsyncClient, service):
+    create_resp = await client.post("/api/v1/sessions", json={})
+    session_id = create_resp.json()["result"]["session_id"]
+    await client.post(
+        f"/api/v1/sessions/{session_id}/messages",
+        json={"role": "user", "content": "Hello"},
+    )
+
+    resp = await client.post(f"/api/v1/sessions/{session_id}/commit", params={"wait": False})
+    assert resp.status_code == 200
+    assert resp.json()["result"]["status"] == "accepted"
+
+    await service.sessions.flush_commits()
+    resp = await client.get(f"/api/v1/sessions/{session_id}")
+    assert resp.json()["result"]["message_count"] == 0
+
+
+async def test_background_commit_does_not_block_other_requests(
+    client: httpx.AsyncClient, service, monkeypatch
+):
+    started = threading.Event()
+    release = threading.Event()
+    finished = threading.Event()
+
+    def _slow_commit(self):
+        started.set()
+        release.wait(timeout=5)
+        finished.set()
+        return {"session_id": self.session_id, "status": "committed"}
+
+    monkeypatch.setattr(Session, "commit", _slow_commit)
+    create_resp = await client.post("/api/v1/sessions", json={})
+    session_id = create_resp.json()["result"]["session_id"]
+
+    resp = await client.post(f"/api/v1/sessions/{session_id}/commit", params={"wait": False})
+    assert resp.status_code == 200
+    assert await asyncio.to_thread(started.wait, 5)
+
+    resp = await client.get(f"/api/v1/sessions/{session_id}")
+    assert resp.status_code == 200
+    assert not finished.is_set()
+
+    release.set()
+    await service.sessions.flush_commits()
+    assert finished.is_set()
+
+
 async def test_extract_session_jsonable_regression(client: httpx.AsyncClient, service, monkeypatch):
     """Regression: extract endpoint should serialize internal objects."""
 
@@ -3,14 +3,16 @@
 
 """Tests for multi-tenant authentication (openviking/server/auth.py)."""
 
+import asyncio
 import uuid
+from typing import Dict, Optional
 
 import httpx
 import pytest
 import pytest_asyncio
 
 from openviking.server.app import create_app
-from openviking.server.config import ServerConfig, _is_localhost, validate_server_config
+from openviking.server.config import ServerConfig
 from openviking.server.dependencies import set_service
 from openviking.service.core import OpenVikingService
 from openviking_cli.session.user_id import UserIdentifier
@@ -21,27 +23,41 @@ def _uid() -> str:
 
 
 ROOT_KEY = "root-secret-key-for-testing-only-1234567890abcdef"
+STATUS_URL = "/api/v1/system/status"
 
+# The shared auth service is initialized on the module loop; tests must run there too
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest_asyncio.fixture(scope="function")
-async def auth_service(temp_dir):
-    """Service for auth tests."""
+
+async def _get_status(
+    client: httpx.AsyncClient, headers: Optional[Dict[str, str]] = None
+) -> httpx.Response:
+    return await client.get(STATUS_URL, headers=headers)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def auth_service(tmp_path_factory):
+    """Service shared by all auth tests in this module."""
     svc = OpenVikingService(
-        path=str(temp_dir / "auth_data"), user=UserIdentifier.the_default_user("auth_user")
+        path=str(tmp_path_factory.mktemp("auth_data")),
+        user=UserIdentifier.the_default_user("auth_user"),
     )
     await svc.initialize()
     yield svc
     await svc.close()
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def auth_app(auth_service):
-    """App with root_api_key configured and APIKeyManager loaded."""
+    """App with root_api_key configured and APIKeyManager loaded.
+
+    Shared across the module: tests only add accounts under unique ``_uid()``
+    names, so they do not observe each other's state.
+    """
     from openviking.server.api_keys import APIKeyManager
 
     config = ServerConfig(root_api_key=ROOT_KEY)
     app = create_app(config=config, service=auth_service)
-    set_service(auth_service)
 
     # Manually initialize APIKeyManager (lifespan not triggered in ASGI tests)
     manager = APIKeyManager(root_key=ROOT_KEY, agfs_url=auth_service._agfs_url)
@@ -51,15 +67,29 @@ async def auth_app(auth_service):
     return app
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest.fixture(autouse=True)
+def _bind_auth_service(request):
+    """Re-bind the shared auth service for each test that uses the auth app.
+
+    Other fixtures (e.g. ``client``) bind their own service in between.
+    """
+    if "auth_app" in request.fixturenames:
+        set_service(request.getfixturevalue("auth_service"))
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def auth_client(auth_app):
-    """Client bound to auth-enabled app."""
+    """Client bound to auth-enabled app, shared across the module.
+
+    Pool limits, HTTP/2 and timeouts only configure httpx's default network
+    transport and are ignored for an explicit ASGITransport, so none are set.
+    """
     transport = httpx.ASGITransport(app=auth_app)
     async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
         yield c
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function", loop_scope="module")
 async def user_key(auth_app):
     """Create a test user and return its key."""
     manager = auth_app.state.api_key_manager
@@ -79,19 +109,13 @@ async def test_health_no_auth_required(auth_client: httpx.AsyncClient):
 
 async def test_root_key_via_x_api_key(auth_client: httpx.AsyncClient):
     """Root key via X-API-Key should grant ROOT access."""
-    resp = await auth_client.get(
-        "/api/v1/system/status",
-        headers={"X-API-Key": ROOT_KEY},
-    )
+    resp = await _get_status(auth_client, {"X-API-Key": ROOT_KEY})
     assert resp.status_code == 200
 
 
 async def test_root_key_via_bearer(auth_client: httpx.AsyncClient):
     """Root key via Bearer token should grant ROOT access."""
-    resp = await auth_client.get(
-        "/api/v1/system/status",
-        headers={"Authorization": f"Bearer {ROOT_KEY}"},
-    )
+    resp = await _get_status(auth_client, {"Authorization": f"Bearer {ROOT_KEY}"})
     assert resp.status_code == 200
 
 
@@ -106,7 +130,7 @@ async def test_user_key_access(auth_client: httpx.AsyncClient, user_key: str):
 
 async def test_missing_key_returns_401(auth_client: httpx.AsyncClient):
     """Request without API key should return 401."""
-    resp = await auth_client.get("/api/v1/system/status")
+    resp = await _get_status(auth_client)
     assert resp.status_code == 401
     body = resp.json()
     assert body["status"] == "error"
@@ -115,42 +139,43 @@ async def test_missing_key_returns_401(auth_client: httpx.AsyncClient):
 
 async def test_wrong_key_returns_401(auth_client: httpx.AsyncClient):
     """Request with invalid key should return 401."""
-    resp = await auth_client.get(
-        "/api/v1/system/status",
-        headers={"X-API-Key": "definitely-wrong-key"},
-    )
+    resp = await _get_status(auth_client, {"X-API-Key": "definitely-wrong-key"})
     assert resp.status_code == 401
 
 
 async def test_bearer_without_prefix_fails(auth_client: httpx.AsyncClient):
     """Authorization header without 'Bearer ' prefix should fail."""
-    resp = await auth_client.get(
-        "/api/v1/system/status",
-        headers={"Authorization": ROOT_KEY},
-    )
+    resp = await _get_status(auth_client, {"Authorization": ROOT_KEY})
     assert resp.status_code == 401
 
 
+# Uses the per-test service and client from conftest, not the module-shared ones
+@pytest.mark.asyncio(loop_scope="function")
 async def test_dev_mode_no_auth(client: httpx.AsyncClient):
     """When no root_api_key configured (dev mode), all requests pass as ROOT."""
-    resp = await client.get("/api/v1/system/status")
+    resp = await _get_status(client)
     assert resp.status_code == 200
 
 
 async def test_auth_on_multiple_endpoints(auth_client: httpx.AsyncClient):
     """Multiple protected endpoints should require auth."""
     endpoints = [
-        ("GET", "/api/v1/system/status"),
+        ("GET", STATUS_URL),
         ("GET", "/api/v1/fs/ls?uri=viking://"),
         ("GET", "/api/v1/observer/system"),
         ("GET", "/api/v1/debug/health"),
     ]
-    for method, url in endpoints:
-        resp = await auth_client.request(method, url)
+    results = await asyncio.gather(*[auth_client.request(method, url) for method, url in endpoints])
+    for (method, url), resp in zip(endpoints, results):
         assert resp.status_code == 401, f"{method} {url} should require auth"
 
-    for method, url in endpoints:
-        resp = await auth_client.request(method, url, headers={"X-API-Key": ROOT_KEY})
+    results = await asyncio.gather(
+        *[
+            auth_client.request(method, url, headers={"X-API-Key": ROOT_KEY})
+            for method, url in endpoints
+        ]
+    )
+    for (method, url), resp in zip(endpoints, results):
         assert resp.status_code == 200, f"{method} {url} should succeed with root key"
 
 
@@ -170,18 +195,17 @@ async def test_user_key_cannot_access_admin_api(auth_client: httpx.AsyncClient,
 
 async def test_agent_id_header_forwarded(auth_client: httpx.AsyncClient):
     """X-OpenViking-Agent header should be captured in identity."""
-    resp = await auth_client.get(
-        "/api/v1/system/status",
-        headers={"X-API-Key": ROOT_KEY, "X-OpenViking-Agent": "my-agent"},
-    )
+    resp = await _get_status(auth_client, {"X-API-Key": ROOT_KEY, "X-OpenViking-Agent": "my-agent"})
     assert resp.status_code == 200
 
 
 async def test_cross_tenant_session_get_returns_not_found(auth_client: httpx.AsyncClient, auth_app):
     """A user must not access another tenant's session by session_id."""
     manager = auth_app.state.api_key_manager
-    alice_key = await manager.create_account(_uid(), "alice")
-    bob_key = await manager.create_account(_uid(), "bob")
+    alice_key, bob_key = await asyncio.gather(
+        manager.create_account(_uid(), "alice"),
+        manager.create_account(_uid(), "bob"),
+    )
 
     create_resp = await auth_client.post(
         "/api/v1/sessions", json={}, headers={"X-API-Key": alice_key}
@@ -196,51 +220,12 @@ async def test_cross_tenant_session_get_returns_not_found(auth_client: httpx.Asy
     )
     assert add_resp.status_code == 200
 
-    own_get = await auth_client.get(
-        f"/api/v1/sessions/{session_id}", headers={"X-API-Key": alice_key}
+    own_get, cross_get = await asyncio.gather(
+        auth_client.get(f"/api/v1/sessions/{session_id}", headers={"X-API-Key": alice_key}),
+        auth_client.get(f"/api/v1/sessions/{session_id}", headers={"X-API-Key": bob_key}),
     )
     assert own_get.status_code == 200
     assert own_get.json()["result"]["message_count"] == 1
 
-    cross_get = await auth_client.get(
-        f"/api/v1/sessions/{session_id}", headers={"X-API-Key": bob_key}
-    )
     assert cross_get.status_code == 404
     assert cross_get.json()["error"]["code"] == "NOT_FOUND"
-
-
-# ---- _is_localhost tests ----
-
-
-@pytest.mark.parametrize("host", ["127.0.0.1", "localhost", "::1"])
-def test_is_localhost_true(host: str):
-    assert _is_localhost(host) is True
-
-
-@pytest.mark.parametrize("host", ["0.0.0.0", "::", "192.168.1.1", "10.0.0.1"])
-def test_is_localhost_false(host: str):
-    assert _is_localhost(host) is False
-
-
-# ---- validate_server_config tests ----
-
-
-def test_validate_no_key_localhost_passes():
-    """No root_api_key + localhost should pass validation."""
-    for host in ("127.0.0.1", "localhost", "::1"):
-        config = ServerConfig(host=host, root_api_key=None)
-        validate_server_config(config)  # should not raise
-
-
-def test_validate_no_key_non_localhost_raises():
-    """No root_api_key + non-localhost should raise SystemExit."""
-    config = ServerConfig(host="0.0.0.0", root_api_key=None)
-    with pytest.raises(SystemExit):
-        validate_server_config(config)
-
-
-def test_validate_with_key_any_host_passes():
-    """With root_api_key set, any host should pass validation."""
-    for host in ("0.0.0.0", "::", "192.168.1.1", "127.0.0.1"):
-        config = ServerConfig(host=host, root_api_key="some-secret-key")
-        validate_server_config(config)  # should not raise
@@ -51,3 +51,11 @@ def test_request_context_account_id_property():
     assert ctx.account_id == "acme"
     assert ctx.role == Role.USER
     assert ctx.user.account_id == "acme"
+
+
+def test_user_identifier_of_reuses_instances():
+    """UserIdentifier.of should return one shared, validated instance per id triple."""
+    user = UserIdentifier.of("acme", "bob", "agent1")
+    assert UserIdentifier.of("acme", "bob", "agent1") is user
+    assert user == UserIdentifier("acme", "bob", "agent1")
+    assert UserIdentifier.of("acme", "bob", "agent2") is not user
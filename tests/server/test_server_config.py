@@ -0,0 +1,45 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for server config validation (openviking/server/config.py)."""
+
+import pytest
+
+from openviking.server.config import ServerConfig, _is_localhost, validate_server_config
+
+# ---- _is_localhost tests ----
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "localhost", "::1"])
+def test_is_localhost_true(host: str):
+    assert _is_localhost(host) is True
+
+
+@pytest.mark.parametrize("host", ["0.0.0.0", "::", "192.168.1.1", "10.0.0.1"])
+def test_is_localhost_false(host: str):
+    assert _is_localhost(host) is False
+
+
+# ---- validate_server_config tests ----
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "localhost", "::1"])
+def test_validate_no_key_localhost_passes(host: str):
+    """No root_api_key + localhost should pass validation."""
+    config = ServerConfig(host=host, root_api_key=None)
+    validate_server_config(config)  # should not raise
+
+
+@pytest.mark.parametrize("host", ["0.0.0.0", "::", "192.168.1.1"])
+def test_validate_no_key_non_localhost_raises(host: str):
+    """No root_api_key + non-localhost should raise SystemExit."""
+    config = ServerConfig(host=host, root_api_key=None)
+    with pytest.raises(SystemExit):
+        validate_server_config(config)
+
+
+@pytest.mark.parametrize("host", ["0.0.0.0", "::", "192.168.1.1", "127.0.0.1"])
+def test_validate_with_key_any_host_passes(host: str):
+    """With root_api_key set, any host should pass validation."""
+    config = ServerConfig(host=host, root_api_key="some-secret-key")
+    validate_server_config(config)  # should not raise
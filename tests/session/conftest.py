@@ -3,7 +3,9 @@
 
 """Session test fixtures"""
 
+from pathlib import Path
 from typing import AsyncGenerator
+from uuid import uuid4
 
 import pytest_asyncio
 
@@ -12,24 +14,56 @@ from openviking.message import TextPart, ToolPart
 from openviking.session import Session
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="package", loop_scope="package")
+async def client(tmp_path_factory) -> AsyncGenerator[AsyncOpenViking, None]:
+    """Initialized client shared by all session tests.
+
+    Overrides the per-test root fixture: session tests only touch their own
+    session ids, so they do not need a fresh store each. Data lives under
+    tmp_path_factory because the root temp_dir fixture wipes TEST_TMP_DIR per test.
+    It lives on the package event loop, so session test modules set
+    ``pytestmark = pytest.mark.asyncio(loop_scope="package")``.
+    """
+    await AsyncOpenViking.reset()
+
+    client = AsyncOpenViking(path=str(tmp_path_factory.mktemp("session_client")))
+    await client.initialize()
+
+    yield client
+
+    await client.close()
+    await AsyncOpenViking.reset()
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="package")
+async def client_with_resource_sync(
+    client: AsyncOpenViking, sample_markdown_file: Path
+) -> AsyncGenerator[tuple[AsyncOpenViking, str], None]:
+    """Root fixture of the same name, run on the shared client's package loop"""
+    result = await client.add_resource(
+        path=str(sample_markdown_file), reason="Test resource", wait=True
+    )
+    yield client, result.get("root_uri", "")
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="package")
 async def session(client: AsyncOpenViking) -> AsyncGenerator[Session, None]:
     """Create new Session"""
     session = client.session()
     yield session
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function", loop_scope="package")
 async def session_with_id(client: AsyncOpenViking) -> AsyncGenerator[Session, None]:
     """Create Session with specified ID"""
-    session = client.session(session_id="test_session_001")
+    session = client.session(session_id=f"test_session_001_{uuid4().hex[:8]}")
     yield session
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function", loop_scope="package")
 async def session_with_messages(client: AsyncOpenViking) -> AsyncGenerator[Session, None]:
     """Create Session with existing messages"""
-    session = client.session(session_id="test_session_with_messages")
+    session = client.session(session_id=f"test_session_with_messages_{uuid4().hex[:8]}")
 
     session.add_message("user", [TextPart("Hello, this is a test message.")])
     session.add_message("assistant", [TextPart("Hello! How can I help you today?")])
@@ -39,12 +73,12 @@ async def session_with_messages(client: AsyncOpenViking) -> AsyncGenerator[Sessi
     yield session
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function", loop_scope="package")
 async def session_with_tool_call(
     client: AsyncOpenViking,
 ) -> AsyncGenerator[tuple[Session, str, str], None]:
     """Create Session with tool call"""
-    session = client.session(session_id="test_session_with_tool")
+    session = client.session(session_id=f"test_session_with_tool_{uuid4().hex[:8]}")
 
     tool_id = "test_tool_001"
     tool_part = ToolPart(
@@ -1,7 +1,8 @@
 # Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 # SPDX-License-Identifier: Apache-2.0
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -33,22 +34,74 @@ class _DummyVikingDB:
         return self._embedder
 
 
+class _FakeVikingDB(_DummyVikingDB):
+    """VikingDB stand-in for compressor tests, recording deletes and embedding enqueues."""
+
+    def __init__(self):
+        super().__init__()
+        self.delete_uris = AsyncMock(return_value=None)
+        self.enqueue_embedding_msg = AsyncMock()
+
+
+class _FakeFS:
+    """VikingFS stand-in exposing the async methods SessionCompressor calls."""
+
+    def __init__(self):
+        self.read_file = AsyncMock()
+        self.write_file = AsyncMock()
+        self.rm = AsyncMock()
+        self.link = AsyncMock()
+
+
 class _DummyEmbedResult:
     def __init__(self, dense_vector):
         self.dense_vector = dense_vector
 
 
 class _DummyEmbedder:
+    # Read-only in tests, so every embed() call can return the same result
+    _RESULT = _DummyEmbedResult([0.1, 0.2, 0.3])
+
     def embed(self, _text):
-        return _DummyEmbedResult([0.1, 0.2, 0.3])
+        return self._RESULT
+
+
+_USER = UserIdentifier("acc1", "test_user", "test_agent")
+_USER_SPACE = _USER.user_space_name()
+_CTX = RequestContext(user=_USER, role=Role.USER)
+_MEM_PREF_PREFIX = f"viking://user/{_USER_SPACE}/memories/preferences"
+# extract() is mocked in compressor tests, so the message list is never mutated
+_TEST_MESSAGES = [Message.create_user("test message")]
+
+
+class _DummyVLM:
+    def __init__(self, response: str):
+        self._response = response
+
+    def is_available(self):
+        return True
+
+    async def get_completion_async(self, _prompt):
+        return self._response
+
+
+@pytest.fixture
+def patch_vlm(monkeypatch):
+    """Make ``get_openviking_config`` in a module return a VLM with a canned response."""
+
+    def _apply(module_path: str, response: str) -> None:
+        config = SimpleNamespace(vlm=_DummyVLM(response))
+        monkeypatch.setattr(f"{module_path}.get_openviking_config", lambda: config)
+
+    return _apply
 
 
 def _make_user() -> UserIdentifier:
-    return UserIdentifier("acc1", "test_user", "test_agent")
+    return _USER
 
 
 def _make_ctx() -> RequestContext:
-    return RequestContext(user=_make_user(), role=Role.USER)
+    return _CTX
 
 
 def _make_candidate() -> CandidateMemory:
@@ -64,10 +117,9 @@ def _make_candidate() -> CandidateMemory:
 
 
 def _make_existing(uri_suffix: str = "existing.md") -> Context:
-    user_space = _make_user().user_space_name()
     return Context(
-        uri=f"viking://user/{user_space}/memories/preferences/{uri_suffix}",
-        parent_uri=f"viking://user/{user_space}/memories/preferences",
+        uri=f"{_MEM_PREF_PREFIX}/{uri_suffix}",
+        parent_uri=_MEM_PREF_PREFIX,
         is_leaf=True,
         abstract="Existing preference memory",
         context_type="memory",
@@ -75,77 +127,77 @@ def _make_existing(uri_suffix: str = "existing.md") -> Context:
     )
 
 
-class TestMemoryDeduplicatorPayload:
-    def test_create_with_empty_list_is_valid(self):
-        dedup = MemoryDeduplicator(vikingdb=_DummyVikingDB())
-        existing = [_make_existing("a.md")]
+def _create_with_empty_list_case():
+    existing = [_make_existing("a.md")]
+    return {"decision": "create", "reason": "new memory", "list": []}, existing, None
 
-        decision, _, actions = dedup._parse_decision_payload(
-            {"decision": "create", "reason": "new memory", "list": []},
-            existing,
-        )
 
-        assert decision == DedupDecision.CREATE
-        assert actions == []
+def _create_with_merge_case():
+    existing = [_make_existing("b.md")]
+    payload = {"decision": "create", "list": [{"uri": existing[0].uri, "decide": "merge"}]}
+    return payload, existing, None
 
-    def test_create_with_merge_is_normalized_to_none(self):
-        dedup = MemoryDeduplicator(vikingdb=_DummyVikingDB())
-        existing = [_make_existing("b.md")]
-
-        decision, _, actions = dedup._parse_decision_payload(
-            {
-                "decision": "create",
-                "list": [{"uri": existing[0].uri, "decide": "merge"}],
-            },
-            existing,
-        )
 
-        assert decision == DedupDecision.NONE
-        assert len(actions) == 1
-        assert actions[0].decision == MemoryActionDecision.MERGE
+def _skip_with_delete_case():
+    existing = [_make_existing("c.md")]
+    payload = {"decision": "skip", "list": [{"uri": existing[0].uri, "decide": "delete"}]}
+    return payload, existing, None
 
-    def test_skip_drops_list_actions(self):
-        dedup = MemoryDeduplicator(vikingdb=_DummyVikingDB())
-        existing = [_make_existing("c.md")]
-
-        decision, _, actions = dedup._parse_decision_payload(
-            {
-                "decision": "skip",
-                "list": [{"uri": existing[0].uri, "decide": "delete"}],
-            },
-            existing,
-        )
 
-        assert decision == DedupDecision.SKIP
-        assert actions == []
+def _cross_facet_delete_case():
+    food = _make_existing("food.md")
+    food.abstract = "饮食偏好: 喜欢吃苹果和草莓"
+    routine = _make_existing("routine.md")
+    routine.abstract = "作息习惯: 每天早上7点起床"
+    candidate = _make_candidate()
+    candidate.abstract = "饮食偏好: 不再喜欢吃水果"
+    candidate.content = "用户不再喜欢吃水果，需要作废过去的水果偏好。"
+    payload = {
+        "decision": "create",
+        "list": [
+            {"uri": food.uri, "decide": "delete"},
+            {"uri": routine.uri, "decide": "delete"},
+        ],
+    }
+    return payload, [food, routine], candidate
 
-    def test_cross_facet_delete_actions_are_kept(self):
-        dedup = MemoryDeduplicator(vikingdb=_DummyVikingDB())
-        food = _make_existing("food.md")
-        food.abstract = "饮食偏好: 喜欢吃苹果和草莓"
-        routine = _make_existing("routine.md")
-        routine.abstract = "作息习惯: 每天早上7点起床"
-        existing = [food, routine]
-        candidate = _make_candidate()
-        candidate.abstract = "饮食偏好: 不再喜欢吃水果"
-        candidate.content = "用户不再喜欢吃水果，需要作废过去的水果偏好。"
-
-        decision, _, actions = dedup._parse_decision_payload(
-            {
-                "decision": "create",
-                "list": [
-                    {"uri": food.uri, "decide": "delete"},
-                    {"uri": routine.uri, "decide": "delete"},
-                ],
-            },
-            existing,
-            candidate,
-        )
 
-        assert decision == DedupDecision.CREATE
-        assert len(actions) == 2
-        assert {a.memory.uri for a in actions} == {food.uri, routine.uri}
-        assert all(a.decision == MemoryActionDecision.DELETE for a in actions)
+@pytest.fixture(scope="module")
+def payload_dedup():
+    """One deduplicator for payload parsing, which only depends on its arguments."""
+    return MemoryDeduplicator(vikingdb=_DummyVikingDB())
+
+
+class TestMemoryDeduplicatorPayload:
+    @pytest.mark.parametrize(
+        "build_case, expected_decision, expected_actions",
+        [
+            # create + empty list is a plain create
+            (_create_with_empty_list_case, DedupDecision.CREATE, []),
+            # create + merge is normalized to none, keeping the merge action
+            (_create_with_merge_case, DedupDecision.NONE, [MemoryActionDecision.MERGE]),
+            # skip drops any list actions
+            (_skip_with_delete_case, DedupDecision.SKIP, []),
+            # deletes across facets are kept alongside create
+            (
+                _cross_facet_delete_case,
+                DedupDecision.CREATE,
+                [MemoryActionDecision.DELETE, MemoryActionDecision.DELETE],
+            ),
+        ],
+        ids=["create_empty", "create_merge", "skip_drops_actions", "cross_facet_delete"],
+    )
+    def test_parse_decision_payload(
+        self, payload_dedup, build_case, expected_decision, expected_actions
+    ):
+        payload, existing, candidate = build_case()
+
+        decision, _, actions = payload_dedup._parse_decision_payload(payload, existing, candidate)
+
+        assert decision == expected_decision
+        assert [a.decision for a in actions] == expected_actions
+        if actions:
+            assert {a.memory.uri for a in actions} == {item["uri"] for item in payload["list"]}
 
     @pytest.mark.asyncio
     async def test_find_similar_memories_uses_path_must_filter_and__score(self):
@@ -161,7 +213,7 @@ class TestMemoryDeduplicatorPayload:
                     "context_type": "memory",
                     "level": 2,
                     "account_id": "acc1",
-                    "owner_space": _make_user().user_space_name(),
+                    "owner_space": _USER_SPACE,
                     "abstract": existing.abstract,
                     "category": "preferences",
                     "_score": 0.82,
@@ -177,10 +229,8 @@ class TestMemoryDeduplicatorPayload:
         assert similar[0].uri == existing.uri
         call = vikingdb.search_similar_memories.await_args.kwargs
         assert call["account_id"] == "acc1"
-        assert call["owner_space"] == _make_user().user_space_name()
-        assert call["category_uri_prefix"] == (
-            f"viking://user/{_make_user().user_space_name()}/memories/preferences/"
-        )
+        assert call["owner_space"] == _USER_SPACE
+        assert call["category_uri_prefix"] == _MEM_PREF_PREFIX + "/"
         assert call["limit"] == 5
 
     @pytest.mark.asyncio
@@ -191,11 +241,11 @@ class TestMemoryDeduplicatorPayload:
             return_value=[
                 {
                     "id": "uri_low",
-                    "uri": f"viking://user/{_make_user().user_space_name()}/memories/preferences/low.md",
+                    "uri": f"{_MEM_PREF_PREFIX}/low.md",
                     "context_type": "memory",
                     "level": 2,
                     "account_id": "acc1",
-                    "owner_space": _make_user().user_space_name(),
+                    "owner_space": _USER_SPACE,
                     "abstract": "low",
                     "_score": 0.68,
                 }
@@ -208,36 +258,30 @@ class TestMemoryDeduplicatorPayload:
         assert len(similar) == 1
 
     @pytest.mark.asyncio
-    async def test_llm_decision_formats_up_to_five_similar_memories(self):
+    async def test_llm_decision_formats_up_to_five_similar_memories(self, patch_vlm, monkeypatch):
         dedup = MemoryDeduplicator(vikingdb=_DummyVikingDB())
-        similar = [_make_existing(f"m_{i}.md") for i in range(6)]
+        similar = [
+            Context(
+                uri=f"{_MEM_PREF_PREFIX}/m_{i}.md",
+                parent_uri=_MEM_PREF_PREFIX,
+                is_leaf=True,
+                abstract="Existing preference memory",
+                context_type="memory",
+                category="preferences",
+            )
+            for i in range(6)
+        ]
         captured = {}
 
         def _fake_render_prompt(_template_id, variables):
             captured.update(variables)
             return "prompt"
 
-        class _DummyVLM:
-            def is_available(self):
-                return True
-
-            async def get_completion_async(self, _prompt):
-                return '{"decision":"skip","reason":"dup"}'
-
-        class _DummyConfig:
-            vlm = _DummyVLM()
-
-        with (
-            patch(
-                "openviking.session.memory_deduplicator.get_openviking_config",
-                return_value=_DummyConfig(),
-            ),
-            patch(
-                "openviking.session.memory_deduplicator.render_prompt",
-                side_effect=_fake_render_prompt,
-            ),
-        ):
-            decision, _, _ = await dedup._llm_decision(_make_candidate(), similar)
+        patch_vlm("openviking.session.memory_deduplicator", '{"decision":"skip","reason":"dup"}')
+        monkeypatch.setattr(
+            "openviking.session.memory_deduplicator.render_prompt", _fake_render_prompt
+        )
+        decision, _, _ = await dedup._llm_decision(_make_candidate(), similar)
 
         assert decision == DedupDecision.SKIP
         existing_text = captured["existing_memories"]
@@ -250,68 +294,46 @@ class TestMemoryDeduplicatorPayload:
 
 @pytest.mark.asyncio
 class TestMemoryMergeBundle:
-    async def test_merge_memory_bundle_parses_structured_response(self):
+    async def test_merge_memory_bundle_parses_structured_response(self, patch_vlm):
         extractor = MemoryExtractor()
+        patch_vlm(
+            "openviking.session.memory_extractor",
+            '{"decision":"merge","abstract":"Tool preference: Use clang","overview":"## '
+            'Preference Domain","content":"Use clang for C++.","reason":"updated"}',
+        )
 
-        class _DummyVLM:
-            def is_available(self):
-                return True
-
-            async def get_completion_async(self, _prompt):
-                return (
-                    '{"decision":"merge","abstract":"Tool preference: Use clang","overview":"## '
-                    'Preference Domain","content":"Use clang for C++.","reason":"updated"}'
-                )
-
-        class _DummyConfig:
-            vlm = _DummyVLM()
-
-        with patch(
-            "openviking.session.memory_extractor.get_openviking_config",
-            return_value=_DummyConfig(),
-        ):
-            payload = await extractor._merge_memory_bundle(
-                existing_abstract="old",
-                existing_overview="",
-                existing_content="old content",
-                new_abstract="new",
-                new_overview="",
-                new_content="new content",
-                category="preferences",
-                output_language="en",
-            )
+        payload = await extractor._merge_memory_bundle(
+            existing_abstract="old",
+            existing_overview="",
+            existing_content="old content",
+            new_abstract="new",
+            new_overview="",
+            new_content="new content",
+            category="preferences",
+            output_language="en",
+        )
 
         assert payload is not None
         assert payload.abstract == "Tool preference: Use clang"
         assert payload.content == "Use clang for C++."
 
-    async def test_merge_memory_bundle_rejects_missing_required_fields(self):
+    async def test_merge_memory_bundle_rejects_missing_required_fields(self, patch_vlm):
         extractor = MemoryExtractor()
+        patch_vlm(
+            "openviking.session.memory_extractor",
+            '{"decision":"merge","abstract":"","overview":"o","content":"","reason":"r"}',
+        )
 
-        class _DummyVLM:
-            def is_available(self):
-                return True
-
-            async def get_completion_async(self, _prompt):
-                return '{"decision":"merge","abstract":"","overview":"o","content":"","reason":"r"}'
-
-        class _DummyConfig:
-            vlm = _DummyVLM()
-
-        with patch(
-            "openviking.session.memory_extractor.get_openviking_config",
-            return_value=_DummyConfig(),
-        ):
-            payload = await extractor._merge_memory_bundle(
-                existing_abstract="old",
-                existing_overview="",
-                existing_content="old content",
-                new_abstract="new",
-                new_overview="",
-                new_content="new content",
-                category="preferences",
-                output_language="en",
-            )
+        payload = await extractor._merge_memory_bundle(
+            existing_abstract="old",
+            existing_overview="",
+            existing_content="old content",
+            new_abstract="new",
+            new_overview="",
+            new_content="new content",
+            category="preferences",
+            output_language="en",
+        )
 
         assert payload is None
 
@@ -340,7 +362,7 @@ class TestProfileMergeSafety:
         assert payload is None
         fs.write_file.assert_not_called()
 
-    async def test_create_memory_skips_profile_index_payload_when_merge_fails(self):
+    async def test_create_memory_skips_profile_index_payload_when_merge_fails(self, monkeypatch):
         extractor = MemoryExtractor()
         candidate = CandidateMemory(
             category=MemoryCategory.PROFILE,
@@ -353,29 +375,37 @@ class TestProfileMergeSafety:
         )
         extractor._append_to_profile = AsyncMock(return_value=None)
 
-        with patch("openviking.session.memory_extractor.get_viking_fs", return_value=MagicMock()):
-            memory = await extractor.create_memory(
-                candidate,
-                user=_make_user(),
-                session_id="s1",
-                ctx=_make_ctx(),
-            )
+        monkeypatch.setattr(
+            "openviking.session.memory_extractor.get_viking_fs", lambda: MagicMock()
+        )
+        memory = await extractor.create_memory(
+            candidate,
+            user=_make_user(),
+            session_id="s1",
+            ctx=_make_ctx(),
+        )
 
         assert memory is None
 
 
+@pytest.fixture
+def compressor_env(monkeypatch):
+    """SessionCompressor wired to fake VikingDB/VikingFS, with indexing stubbed out."""
+    vikingdb = _FakeVikingDB()
+    fs = _FakeFS()
+    compressor = SessionCompressor(vikingdb=vikingdb)
+    compressor._index_memory = AsyncMock(return_value=True)
+    monkeypatch.setattr("openviking.session.compressor.get_viking_fs", lambda: fs)
+    return SimpleNamespace(compressor=compressor, vikingdb=vikingdb, fs=fs)
+
+
 @pytest.mark.asyncio
 class TestSessionCompressorDedupActions:
-    async def test_create_with_empty_list_only_creates_new_memory(self):
+    async def test_create_with_empty_list_only_creates_new_memory(self, compressor_env):
         candidate = _make_candidate()
         new_memory = _make_existing("created.md")
 
-        vikingdb = MagicMock()
-        vikingdb.get_embedder.return_value = None
-        vikingdb.delete_uris = AsyncMock(return_value=None)
-        vikingdb.enqueue_embedding_msg = AsyncMock()
-
-        compressor = SessionCompressor(vikingdb=vikingdb)
+        compressor = compressor_env.compressor
         compressor.extractor.extract = AsyncMock(return_value=[candidate])
         compressor.extractor.create_memory = AsyncMock(return_value=new_memory)
         compressor.deduplicator.deduplicate = AsyncMock(
@@ -386,34 +416,26 @@ class TestSessionCompressorDedupActions:
                 actions=[],
             )
         )
-        compressor._index_memory = AsyncMock(return_value=True)
 
-        fs = MagicMock()
-        fs.rm = AsyncMock()
-
-        with patch("openviking.session.compressor.get_viking_fs", return_value=fs):
-            memories = await compressor.extract_long_term_memories(
-                [Message.create_user("test message")],
-                user=_make_user(),
-                session_id="session_test",
-                ctx=_make_ctx(),
-            )
+        fs = compressor_env.fs
+
+        memories = await compressor.extract_long_term_memories(
+            _TEST_MESSAGES,
+            user=_make_user(),
+            session_id="session_test",
+            ctx=_make_ctx(),
+        )
 
         assert len(memories) == 1
         assert memories[0].uri == new_memory.uri
         fs.rm.assert_not_called()
         compressor.extractor.create_memory.assert_awaited_once()
 
-    async def test_create_with_merge_is_executed_as_none(self):
+    async def test_create_with_merge_is_executed_as_none(self, compressor_env):
         candidate = _make_candidate()
         target = _make_existing("merge_target.md")
 
-        vikingdb = MagicMock()
-        vikingdb.get_embedder.return_value = None
-        vikingdb.delete_uris = AsyncMock(return_value=None)
-        vikingdb.enqueue_embedding_msg = AsyncMock()
-
-        compressor = SessionCompressor(vikingdb=vikingdb)
+        compressor = compressor_env.compressor
         compressor.extractor.extract = AsyncMock(return_value=[candidate])
         compressor.extractor.create_memory = AsyncMock(return_value=_make_existing("never.md"))
         compressor.extractor._merge_memory_bundle = AsyncMock(
@@ -437,20 +459,16 @@ class TestSessionCompressorDedupActions:
                 ],
             )
         )
-        compressor._index_memory = AsyncMock(return_value=True)
 
-        fs = MagicMock()
-        fs.read_file = AsyncMock(return_value="old memory content")
-        fs.write_file = AsyncMock()
-        fs.rm = AsyncMock()
-
-        with patch("openviking.session.compressor.get_viking_fs", return_value=fs):
-            memories = await compressor.extract_long_term_memories(
-                [Message.create_user("test message")],
-                user=_make_user(),
-                session_id="session_test",
-                ctx=_make_ctx(),
-            )
+        fs = compressor_env.fs
+        fs.read_file.return_value = "old memory content"
+
+        memories = await compressor.extract_long_term_memories(
+            _TEST_MESSAGES,
+            user=_make_user(),
+            session_id="session_test",
+            ctx=_make_ctx(),
+        )
 
         assert memories == []
         compressor.extractor.create_memory.assert_not_called()
@@ -459,16 +477,11 @@ class TestSessionCompressorDedupActions:
         assert target.meta["overview"] == "merged overview"
         compressor._index_memory.assert_awaited_once()
 
-    async def test_merge_bundle_failure_is_skipped_without_fallback(self):
+    async def test_merge_bundle_failure_is_skipped_without_fallback(self, compressor_env):
         candidate = _make_candidate()
         target = _make_existing("merge_target_fail.md")
 
-        vikingdb = MagicMock()
-        vikingdb.get_embedder.return_value = None
-        vikingdb.delete_uris = AsyncMock(return_value=None)
-        vikingdb.enqueue_embedding_msg = AsyncMock()
-
-        compressor = SessionCompressor(vikingdb=vikingdb)
+        compressor = compressor_env.compressor
         compressor.extractor.extract = AsyncMock(return_value=[candidate])
         compressor.extractor._merge_memory_bundle = AsyncMock(return_value=None)
         compressor.deduplicator.deduplicate = AsyncMock(
@@ -484,37 +497,28 @@ class TestSessionCompressorDedupActions:
                 ],
             )
         )
-        compressor._index_memory = AsyncMock(return_value=True)
 
-        fs = MagicMock()
-        fs.read_file = AsyncMock(return_value="old memory content")
-        fs.write_file = AsyncMock()
-        fs.rm = AsyncMock()
-
-        with patch("openviking.session.compressor.get_viking_fs", return_value=fs):
-            memories = await compressor.extract_long_term_memories(
-                [Message.create_user("test message")],
-                user=_make_user(),
-                session_id="session_test",
-                ctx=_make_ctx(),
-            )
+        fs = compressor_env.fs
+        fs.read_file.return_value = "old memory content"
+
+        memories = await compressor.extract_long_term_memories(
+            _TEST_MESSAGES,
+            user=_make_user(),
+            session_id="session_test",
+            ctx=_make_ctx(),
+        )
 
         assert memories == []
         fs.write_file.assert_not_called()
         compressor._index_memory.assert_not_called()
 
-    async def test_create_with_delete_runs_delete_before_create(self):
+    async def test_create_with_delete_runs_delete_before_create(self, compressor_env):
         candidate = _make_candidate()
         target = _make_existing("to_delete.md")
         new_memory = _make_existing("created_after_delete.md")
         call_order = []
 
-        vikingdb = MagicMock()
-        vikingdb.get_embedder.return_value = None
-        vikingdb.delete_uris = AsyncMock(return_value=None)
-        vikingdb.enqueue_embedding_msg = AsyncMock()
-
-        compressor = SessionCompressor(vikingdb=vikingdb)
+        compressor = compressor_env.compressor
         compressor.extractor.extract = AsyncMock(return_value=[candidate])
         compressor.deduplicator.deduplicate = AsyncMock(
             return_value=DedupResult(
@@ -535,9 +539,8 @@ class TestSessionCompressorDedupActions:
             return new_memory
 
         compressor.extractor.create_memory = AsyncMock(side_effect=_create_memory)
-        compressor._index_memory = AsyncMock(return_value=True)
 
-        fs = MagicMock()
+        fs = compressor_env.fs
 
         async def _rm(*_args, **_kwargs):
             call_order.append("delete")
@@ -545,14 +548,13 @@ class TestSessionCompressorDedupActions:
 
         fs.rm = AsyncMock(side_effect=_rm)
 
-        with patch("openviking.session.compressor.get_viking_fs", return_value=fs):
-            memories = await compressor.extract_long_term_memories(
-                [Message.create_user("test message")],
-                user=_make_user(),
-                session_id="session_test",
-                ctx=_make_ctx(),
-            )
+        memories = await compressor.extract_long_term_memories(
+            _TEST_MESSAGES,
+            user=_make_user(),
+            session_id="session_test",
+            ctx=_make_ctx(),
+        )
 
         assert [m.uri for m in memories] == [new_memory.uri]
         assert call_order == ["delete", "create"]
-        vikingdb.delete_uris.assert_awaited_once_with(_make_ctx(), [target.uri])
+        compressor_env.vikingdb.delete_uris.assert_awaited_once_with(_make_ctx(), [target.uri])
@@ -3,10 +3,17 @@
 
 """Commit tests"""
 
+import asyncio
+from uuid import uuid4
+
+import pytest
+
 from openviking import AsyncOpenViking
 from openviking.message import TextPart
 from openviking.session import Session
 
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+
 
 class TestCommit:
     """Test commit"""
@@ -46,26 +53,33 @@ class TestCommit:
         result = session.commit()
 
         assert isinstance(result, dict)
+        assert result.get("status") == "committed"
+        # Fast path: nothing archived, so no archive summary or memory extraction ran
+        assert result.get("archived") is False
+        assert result.get("memories_extracted") == 0
+        assert session._compression.compression_index == 0
 
     async def test_commit_multiple_times(self, client: AsyncOpenViking):
-        """Test multiple commits"""
-        session = client.session(session_id="multi_commit_test")
+        """Test multiple commits, with rounds racing on worker threads"""
+        session = client.session(session_id=f"multi_commit_test_{uuid4().hex[:8]}")
+
+        def conversation_round(label: str):
+            session.add_message("user", [TextPart(f"{label} round message")])
+            session.add_message("assistant", [TextPart(f"{label} round response")])
+            return session.commit()
 
-        # First round of conversation
-        session.add_message("user", [TextPart("First round message")])
-        session.add_message("assistant", [TextPart("First round response")])
-        result1 = session.commit()
-        assert result1.get("status") == "committed"
+        results = await asyncio.gather(
+            asyncio.to_thread(conversation_round, "First"),
+            asyncio.to_thread(conversation_round, "Second"),
+        )
 
-        # Second round of conversation
-        session.add_message("user", [TextPart("Second round message")])
-        session.add_message("assistant", [TextPart("Second round response")])
-        result2 = session.commit()
-        assert result2.get("status") == "committed"
+        assert [r.get("status") for r in results] == ["committed", "committed"]
+        # Whichever commit ran second archived anything the first one missed
+        assert session.messages == []
 
     async def test_commit_with_usage_records(self, client: AsyncOpenViking):
         """Test commit with usage records"""
-        session = client.session(session_id="usage_commit_test")
+        session = client.session(session_id=f"usage_commit_test_{uuid4().hex[:8]}")
 
         session.add_message("user", [TextPart("Test message")])
         session.used(contexts=["viking://user/test/resources/doc.md"])
@@ -76,6 +90,24 @@ class TestCommit:
         assert result.get("status") == "committed"
         assert "active_count_updated" in result
 
+    async def test_commit_with_messages_and_usage(self, client: AsyncOpenViking):
+        """commit_with fuses add_message/used/commit"""
+        session = client.session(session_id=f"commit_with_test_{uuid4().hex[:8]}")
+
+        result = session.commit_with(
+            messages=[
+                ("user", [TextPart("Test message")]),
+                ("assistant", [TextPart("Response")]),
+            ],
+            contexts=["viking://user/test/resources/doc.md"],
+        )
+
+        assert result.get("status") == "committed"
+        assert result.get("archived") is True
+        assert result["stats"]["total_turns"] == 1
+        assert result["stats"]["contexts_used"] == 1
+        assert session.messages == []
+
     async def test_active_count_incremented_after_commit(self, client_with_resource_sync: tuple):
         """Regression test: active_count must actually increment after commit.
 
@@ -106,9 +138,11 @@ class TestCommit:
         count_before = records_before[0].get("active_count") or 0
 
         # Mark as used and commit
-        session = client.session(session_id="active_count_regression_test")
+        session = client.session(session_id=f"active_count_regression_test_{uuid4().hex[:8]}")
         session.add_message("user", [TextPart("Query")])
         session.used(contexts=[uri])
+        # Repeated use of the same URI is counted once per commit
+        session.used(contexts=[uri, uri])
         session.add_message("assistant", [TextPart("Answer")])
         result = session.commit()
 
@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
 
 import pytest
 
@@ -12,15 +11,15 @@ from openviking_cli.session.user_id import UserIdentifier
 
 
 @pytest.mark.asyncio
-async def test_delete_existing_memory_uses_vikingdb_manager():
+async def test_delete_existing_memory_uses_vikingdb_manager(arecorder):
     compressor = SessionCompressor.__new__(SessionCompressor)
-    compressor.vikingdb = AsyncMock()
-    viking_fs = AsyncMock()
+    compressor.vikingdb = SimpleNamespace(delete_uris=arecorder())
+    viking_fs = SimpleNamespace(rm=arecorder())
     memory = SimpleNamespace(uri="viking://user/user1/memories/events/e1")
     ctx = RequestContext(user=UserIdentifier("acc1", "user1", "agent1"), role=Role.USER)
 
     ok = await SessionCompressor._delete_existing_memory(compressor, memory, viking_fs, ctx)
 
     assert ok is True
-    viking_fs.rm.assert_awaited_once_with(memory.uri, recursive=False, ctx=ctx)
-    compressor.vikingdb.delete_uris.assert_awaited_once_with(ctx, [memory.uri])
+    assert viking_fs.rm.calls == [((memory.uri,), {"recursive": False, "ctx": ctx})]
+    assert compressor.vikingdb.delete_uris.calls == [((ctx, [memory.uri]), {})]
@@ -3,10 +3,16 @@
 
 """Context retrieval tests"""
 
+from uuid import uuid4
+
+import pytest
+
 from openviking import AsyncOpenViking
 from openviking.message import TextPart
 from openviking.session import Session
 
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+
 
 class TestGetContextForSearch:
     """Test get_context_for_search"""
@@ -28,7 +34,7 @@ class TestGetContextForSearch:
 
     async def test_get_context_with_max_archives(self, client: AsyncOpenViking):
         """Test limiting max archives"""
-        session = client.session(session_id="archive_context_test")
+        session = client.session(session_id=f"archive_context_test_{uuid4().hex[:8]}")
 
         # Add messages and commit (create archive)
         session.add_message("user", [TextPart("First message")])
@@ -50,7 +56,7 @@ class TestGetContextForSearch:
 
     async def test_get_context_after_commit(self, client: AsyncOpenViking):
         """Test getting context after commit"""
-        session = client.session(session_id="post_commit_context_test")
+        session = client.session(session_id=f"post_commit_context_test_{uuid4().hex[:8]}")
 
         # Add messages
         session.add_message("user", [TextPart("Test message before commit")])
@@ -3,9 +3,15 @@
 
 """Session lifecycle tests"""
 
+from uuid import uuid4
+
+import pytest
+
 from openviking import AsyncOpenViking
 from openviking.session import Session
 
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+
 
 class TestSessionCreate:
     """Test Session creation"""
@@ -27,8 +33,8 @@ class TestSessionCreate:
 
     async def test_create_multiple_sessions(self, client: AsyncOpenViking):
         """Test creating multiple sessions"""
-        session1 = client.session(session_id="session_1")
-        session2 = client.session(session_id="session_2")
+        session1 = client.session(session_id=f"session_1_{uuid4().hex[:8]}")
+        session2 = client.session(session_id=f"session_2_{uuid4().hex[:8]}")
 
         assert session1.session_id != session2.session_id
 
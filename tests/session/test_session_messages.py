@@ -3,9 +3,13 @@
 
 """Message management tests"""
 
+import pytest
+
 from openviking.message import ContextPart, TextPart, ToolPart
 from openviking.session import Session
 
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+
 
 class TestAddMessage:
     """Test add_message"""
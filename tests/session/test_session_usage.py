@@ -3,9 +3,13 @@
 
 """Usage record tests"""
 
+import pytest
+
 from openviking.message import TextPart
 from openviking.session import Session
 
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+
 
 class TestUsed:
     """Test usage recording"""
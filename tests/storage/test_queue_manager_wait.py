@@ -0,0 +1,46 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+
+import pytest
+
+from openviking.storage.queuefs.named_queue import DequeueHandlerBase, NamedQueue
+from openviking.storage.queuefs.queue_manager import QueueManager
+
+
+class _EmptyQueueAGFS:
+    def mkdir(self, path):
+        pass
+
+    def read(self, path):
+        return b"0"
+
+
+class _Handler(DequeueHandlerBase):
+    async def on_dequeue(self, data):
+        return data
+
+
+@pytest.mark.asyncio
+async def test_wait_complete_wakes_on_completion_instead_of_poll_interval():
+    manager = QueueManager(agfs=_EmptyQueueAGFS())
+    handler = _Handler()
+    queue = NamedQueue(
+        manager._agfs,
+        manager.mount_point,
+        "Test",
+        dequeue_handler=handler,
+        activity=manager._activity,
+    )
+    manager._queues["Test"] = queue
+    queue._on_dequeue_start()
+    threading.Timer(0.05, handler.report_success).start()
+
+    start = time.monotonic()
+    status = await manager.wait_complete("Test", timeout=10, poll_interval=5)
+
+    assert time.monotonic() - start < 2
+    assert status["Test"].processed == 1
+    assert status["Test"].is_complete
@@ -1,6 +1,8 @@
 # Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+
 import pytest
 
 from openviking.server.identity import RequestContext, Role
@@ -12,8 +14,10 @@ class _FakeVikingFS:
     def __init__(self, tree):
         self._tree = tree
         self.writes = []
+        self.listed = []
 
     async def ls(self, uri, ctx=None):
+        self.listed.append(uri)
         return self._tree.get(uri, [])
 
     async def write_file(self, path, content, ctx=None):
@@ -24,6 +28,10 @@ class _FakeProcessor:
     def __init__(self):
         self.vectorized_dirs = []
         self.vectorized_files = []
+        self.vectorize_batches = []
+        # Batches run as fire-and-forget tasks; set once expected_files are vectorized
+        self.expected_files = None
+        self.files_done = asyncio.Event()
 
     async def _generate_single_file_summary(self, file_path, llm_sem=None, ctx=None):
         return {"name": file_path.split("/")[-1], "summary": "summary"}
@@ -37,10 +45,51 @@ class _FakeProcessor:
     async def _vectorize_directory_simple(self, uri, context_type, abstract, overview, ctx=None):
         self.vectorized_dirs.append(uri)
 
+    async def _vectorize_files_batch(self, parent_uri, context_type, items, ctx=None):
+        self.vectorize_batches.append((parent_uri, [path for path, _ in items]))
+        for file_path, summary_dict in items:
+            await self._vectorize_single_file(parent_uri, context_type, file_path, summary_dict)
+
     async def _vectorize_single_file(
         self, parent_uri, context_type, file_path, summary_dict, ctx=None
     ):
         self.vectorized_files.append(file_path)
+        if len(self.vectorized_files) == self.expected_files:
+            self.files_done.set()
+
+
+def _make_tree(root_uri, fanout, depth, files_per_dir):
+    """Build a synthetic directory tree; returns (tree, dir_count, file_count)."""
+    tree = {}
+    dirs, files = 0, 0
+    level = [root_uri]
+    for current_depth in range(depth + 1):
+        next_level = []
+        for dir_uri in level:
+            dirs += 1
+            entries = [{"name": f"f{i}.txt", "isDir": False} for i in range(files_per_dir)]
+            files += files_per_dir
+            if current_depth < depth:
+                for i in range(fanout):
+                    entries.append({"name": f"d{i}", "isDir": True})
+                    next_level.append(f"{dir_uri}/d{i}")
+            tree[dir_uri] = entries
+        level = next_level
+    return tree, dirs, files
+
+
+def _make_executor(monkeypatch, tree):
+    fake_fs = _FakeVikingFS(tree)
+    monkeypatch.setattr("openviking.storage.queuefs.semantic_dag.get_viking_fs", lambda: fake_fs)
+    processor = _FakeProcessor()
+    ctx = RequestContext(user=UserIdentifier("acc1", "user1", "agent1"), role=Role.USER)
+    executor = SemanticDagExecutor(
+        processor=processor,
+        context_type="resource",
+        max_concurrent_llm=2,
+        ctx=ctx,
+    )
+    return executor, processor, fake_fs
 
 
 @pytest.mark.asyncio
@@ -56,17 +105,7 @@ async def test_semantic_dag_stats_collects_nodes(monkeypatch):
             {"name": "c.txt", "isDir": False},
         ],
     }
-    fake_fs = _FakeVikingFS(tree)
-    monkeypatch.setattr("openviking.storage.queuefs.semantic_dag.get_viking_fs", lambda: fake_fs)
-
-    processor = _FakeProcessor()
-    ctx = RequestContext(user=UserIdentifier("acc1", "user1", "agent1"), role=Role.USER)
-    executor = SemanticDagExecutor(
-        processor=processor,
-        context_type="resource",
-        max_concurrent_llm=2,
-        ctx=ctx,
-    )
+    executor, processor, fake_fs = _make_executor(monkeypatch, tree)
     await executor.run(root_uri)
 
     stats = executor.get_stats()
@@ -76,9 +115,42 @@ async def test_semantic_dag_stats_collects_nodes(monkeypatch):
     assert stats.done_nodes == 5
     assert stats.in_progress_nodes == 0
     assert processor.vectorized_dirs == [f"{root_uri}/child", root_uri]
+    # Each directory is listed exactly once per run
+    assert sorted(fake_fs.listed) == [root_uri, f"{root_uri}/child"]
     assert sorted(processor.vectorized_files) == sorted(
         [f"{root_uri}/a.txt", f"{root_uri}/b.txt", f"{root_uri}/child/c.txt"]
     )
+    # One flush per directory: both root files travel together.
+    assert sorted((uri, sorted(paths)) for uri, paths in processor.vectorize_batches) == [
+        (root_uri, [f"{root_uri}/a.txt", f"{root_uri}/b.txt"]),
+        (f"{root_uri}/child", [f"{root_uri}/child/c.txt"]),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fanout,depth,files_per_dir",
+    [(3, 3, 5), (2, 2, 70)],
+    ids=["deep", "wide"],
+)
+async def test_semantic_dag_stats_large_tree(monkeypatch, fanout, depth, files_per_dir):
+    root_uri = "viking://resources/root"
+    tree, dirs, files = _make_tree(root_uri, fanout, depth, files_per_dir)
+    executor, processor, fake_fs = _make_executor(monkeypatch, tree)
+    processor.expected_files = files
+
+    await executor.run(root_uri)
+    await asyncio.wait_for(processor.files_done.wait(), timeout=5)
+
+    stats = executor.get_stats()
+    assert stats.total_nodes == dirs + files
+    assert stats.done_nodes == dirs + files
+    assert stats.pending_nodes == 0
+    assert stats.in_progress_nodes == 0
+    assert len(fake_fs.listed) == dirs
+    assert len(processor.vectorized_dirs) == dirs
+    assert len(processor.vectorized_files) == files
+    assert all(len(paths) <= 32 for _, paths in processor.vectorize_batches)
 
 
 if __name__ == "__main__":
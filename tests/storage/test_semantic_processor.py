@@ -0,0 +1,34 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from openviking.storage.queuefs.semantic_processor import SemanticProcessor
+
+
+class _CountingProcessor(SemanticProcessor):
+    def __init__(self, max_concurrent_llm):
+        super().__init__(max_concurrent_llm=max_concurrent_llm)
+        self.active = 0
+        self.peak = 0
+
+    async def _generate_single_file_summary(self, file_path, llm_sem=None, ctx=None):
+        async with llm_sem:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0)
+            self.active -= 1
+        return {"name": file_path.split("/")[-1], "summary": "summary"}
+
+
+@pytest.mark.asyncio
+async def test_generate_file_summaries_shares_llm_limit():
+    processor = _CountingProcessor(max_concurrent_llm=2)
+    paths = [f"viking://resources/root/f{i}.txt" for i in range(6)]
+
+    summaries = await processor._generate_file_summaries(paths)
+
+    assert [s["name"] for s in summaries] == [f"f{i}.txt" for i in range(6)]
+    assert processor.peak == 2
@@ -0,0 +1,53 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Scope-filter tests for VikingVectorIndexBackend.search_in_tenant."""
+
+import pytest
+
+from openviking.server.identity import RequestContext, Role
+from openviking.storage.expr import RawDSL
+from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
+from openviking_cli.session.user_id import UserIdentifier
+
+
+class _RecordingBackend(VikingVectorIndexBackend):
+    def __init__(self):
+        self.calls = []
+
+    async def search(self, **kwargs):
+        self.calls.append(kwargs)
+        return [{"uri": "viking://resources/a"}]
+
+
+def _root_ctx():
+    return RequestContext(user=UserIdentifier.the_default_user(), role=Role.ROOT)
+
+
+@pytest.mark.asyncio
+async def test_search_in_tenant_skips_unscoped_search_without_vector():
+    backend = _RecordingBackend()
+
+    assert await backend.search_in_tenant(_root_ctx(), query_vector=None) == []
+    assert backend.calls == []
+
+
+@pytest.mark.asyncio
+async def test_search_in_tenant_unscoped_vector_search_uses_empty_filter():
+    backend = _RecordingBackend()
+
+    await backend.search_in_tenant(_root_ctx(), query_vector=[0.1, 0.2])
+
+    assert len(backend.calls) == 1
+    scope_filter = backend.calls[0]["filter"]
+    assert isinstance(scope_filter, RawDSL)
+    assert scope_filter.payload == {"op": "and", "conds": []}
+
+
+@pytest.mark.asyncio
+async def test_search_in_tenant_scoped_search_without_vector_still_runs():
+    backend = _RecordingBackend()
+
+    await backend.search_in_tenant(_root_ctx(), query_vector=None, context_type="memory")
+
+    assert len(backend.calls) == 1
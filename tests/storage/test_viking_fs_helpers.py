@@ -0,0 +1,186 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from openviking.storage.viking_fs import RelationEntry, VikingFS
+
+
+@pytest.mark.parametrize(
+    "text,offset,limit",
+    [
+        ("", 0, 1),
+        ("a\nb\nc", 1, -1),
+        ("a\nb\nc", 1, 1),
+        ("a\nb\nc\n", 0, 2),
+        ("a\r\nb\r\nc", 1, 5),
+        ("a\rb\rc", 1, 1),
+        ("a\r\n\rb", 1, -1),
+        ("a\u2028b\x0cc\n", 0, 2),
+        ("a\u2028b\x0cc\n", 2, -1),
+        ("a\nb", 4, -1),
+        ("a\nb", 0, 0),
+    ],
+)
+def test_slice_lines_matches_splitlines(text, offset, limit):
+    lines = text.splitlines(keepends=True)
+    expected = "".join(lines[offset:] if limit == -1 else lines[offset : offset + limit])
+    assert VikingFS._slice_lines(text, offset, limit) == expected
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (b"", ""),
+        ("hello 世界".encode("utf-8"), "hello 世界"),
+        (b"\xef\xbb\xbfbom", "bom"),
+        ("utf16".encode("utf-16"), "utf16"),
+        ("中文内容".encode("gbk"), "中文内容"),
+        (
+            ("x = 1\n" * 500 + "# 中文注释\n").encode("gbk"),
+            "x = 1\n" * 500 + "# 中文注释\n",
+        ),
+        (b"caf\xe9", "caf\xe9"),
+    ],
+)
+def test_decode_bytes(data, expected):
+    assert VikingFS(agfs=None)._decode_bytes(data) == expected
+
+
+class _RelationAGFS:
+    def __init__(self):
+        self.files = {}
+        self.mtimes = {}
+        self.reads = 0
+
+    def stat(self, path):
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        return {"modTime": self.mtimes[path], "size": len(self.files[path])}
+
+    def read(self, path, offset=0, size=-1):
+        self.reads += 1
+        return self.files[path]
+
+    def write(self, path, data):
+        self.files[path] = data
+        self.mtimes[path] = self.mtimes.get(path, 0) + 1
+        return "OK"
+
+
+@pytest.mark.asyncio
+async def test_relation_table_cache_reuses_parse_until_rewrite():
+    agfs = _RelationAGFS()
+    fs = VikingFS(agfs=agfs)
+    await fs._write_relation_table("/local/acc/resources/a", [RelationEntry("link_1", ["x"])])
+
+    first = await fs._read_relation_table("/local/acc/resources/a")
+    first[0].uris.append("mutated")
+    second = await fs._read_relation_table("/local/acc/resources/a")
+    assert agfs.reads == 1
+    assert second[0].uris == ["x"]
+
+    await fs._write_relation_table("/local/acc/resources/a", [RelationEntry("link_1", ["y"])])
+    third = await fs._read_relation_table("/local/acc/resources/a")
+    assert agfs.reads == 2
+    assert third[0].uris == ["y"]
+    assert await fs._read_relation_table("/local/acc/resources/missing") == []
+
+
+def test_shorten_component_hashes_long_names_once():
+    long_name = "m" * 300
+    VikingFS._shorten_component.cache_clear()
+    first = VikingFS._shorten_component(long_name, 255)
+    second = VikingFS._shorten_component(long_name, 255)
+
+    assert first == second
+    assert len(first.encode("utf-8")) <= 255
+    assert VikingFS._shorten_component("short", 255) == "short"
+    info = VikingFS._shorten_component.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+
+
+class _CopyOnlyAGFS:
+    """AGFS without rename whose write drops the first attempt mid-stream."""
+
+    def __init__(self, files, fail_attempts=0):
+        self.files = dict(files)
+        self.fail_attempts = fail_attempts
+        self.removed = []
+
+    def mkdir(self, path):
+        pass
+
+    def mv(self, old_path, new_path):
+        raise RuntimeError("rename not supported")
+
+    def stat(self, path):
+        return {"size": len(self.files[path])}
+
+    def read(self, path, offset=0, size=-1):
+        data = self.files[path]
+        return data[offset:] if size < 0 else data[offset : offset + size]
+
+    def write(self, path, data, max_retries=3):
+        for attempt in range(max_retries + 1):
+            # Mirrors the HTTP client: every attempt re-sends the same ``data``
+            body = data if isinstance(data, bytes) else iter(data)
+            received = next(body, b"")
+            if self.fail_attempts > 0:
+                self.fail_attempts -= 1
+                if attempt < max_retries:
+                    continue
+                raise ConnectionError("connection reset")
+            self.files[path] = received + b"".join(body)
+            return "OK"
+
+    def rm(self, path, recursive=False):
+        self.removed.append(path)
+        del self.files[path]
+
+
+@pytest.mark.asyncio
+async def test_move_file_copy_fallback_keeps_source_when_write_fails(monkeypatch):
+    monkeypatch.setattr(VikingFS, "_COPY_CHUNK_BYTES", 4)
+    agfs = _CopyOnlyAGFS({"/local/default/resources/a.txt": b"0123456789"}, fail_attempts=1)
+    fs = VikingFS(agfs=agfs)
+
+    with pytest.raises(ConnectionError):
+        await fs.move_file("viking://resources/a.txt", "viking://resources/b.txt")
+
+    assert agfs.removed == []
+    assert agfs.files["/local/default/resources/a.txt"] == b"0123456789"
+
+
+@pytest.mark.asyncio
+async def test_move_file_copy_fallback_streams_whole_file(monkeypatch):
+    monkeypatch.setattr(VikingFS, "_COPY_CHUNK_BYTES", 4)
+    agfs = _CopyOnlyAGFS({"/local/default/resources/a.txt": b"0123456789"})
+    fs = VikingFS(agfs=agfs)
+
+    await fs.move_file("viking://resources/a.txt", "viking://resources/b.txt")
+
+    assert agfs.files == {"/local/default/resources/b.txt": b"0123456789"}
+
+
+class _WriteAGFS:
+    def __init__(self):
+        self.files = {}
+
+    def mkdir(self, path):
+        pass
+
+    def write(self, path, data):
+        self.files[path] = data
+        return "OK"
+
+
+@pytest.mark.asyncio
+async def test_write_context_skips_missing_abstract_and_overview():
+    agfs = _WriteAGFS()
+    fs = VikingFS(agfs=agfs)
+
+    await fs.write_context("viking://agent/skills/s", content="body", abstract=None, overview="")
+
+    assert agfs.files == {"/local/default/agent/skills/s/content.md": b"body"}
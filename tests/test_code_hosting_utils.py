@@ -145,3 +145,20 @@ def test_is_git_repo_url_unknown_domain():
 
 def test_is_git_repo_url_single_segment():
     assert is_git_repo_url("https://github.com/org") is False
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://github.com/my.org/re po!", "my_org/re_po_"),
+        ("git@github.com:org-a/repo_b.git", "org-a/repo_b"),
+        ("https://github.com/组织/仓库~x", "组织/仓库_x"),
+    ],
+)
+def test_parse_code_hosting_url_sanitizes_segments(url, expected):
+    assert parse_code_hosting_url(url) == expected
+
+
+@pytest.mark.parametrize("url", ["github.com/org/repo", "ftp://github.com/org/repo", ""])
+def test_is_code_hosting_url_rejects_schemeless_urls(url):
+    assert is_code_hosting_url(url) is False